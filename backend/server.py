@@ -778,4 +778,8 @@ async def startup_event():
 async def shutdown_db_client():
     if orchestrator:
         await orchestrator.cleanup()
+    # The MCP connectors share one process-wide HTTP client owned by the
+    # application, not by any single connector; close it exactly once here
+    from agents.mcp_connector import aclose_shared_client
+    await aclose_shared_client()
     client.close()
\ No newline at end of file